@@ -0,0 +1,85 @@
+"""Unit tests for the inventory TTL cache."""
+
+from unittest.mock import Mock
+
+from truenas_storage_monitor.cache import InventoryCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInventoryCache:
+    """Tests for hit, miss and expiry behavior."""
+
+    def test_hit_within_ttl_and_refresh_after_expiry(self):
+        """Entries are reused until the TTL elapses."""
+        clock = FakeClock()
+        cache = InventoryCache(ttl_seconds=30, clock=clock)
+        loader = Mock(side_effect=[["a"], ["b"]])
+
+        assert cache.get("pvs", loader) == ["a"]
+        clock.now = 29
+        assert cache.get("pvs", loader) == ["a"]
+        assert loader.call_count == 1
+
+        clock.now = 30
+        assert cache.get("pvs", loader) == ["b"]
+        assert loader.call_count == 2
+
+    def test_zero_ttl_does_not_reuse_outside_shared_block(self):
+        """With caching disabled every call reaches the loader."""
+        cache = InventoryCache(ttl_seconds=0)
+        loader = Mock(return_value=[])
+
+        cache.get("pvs", loader)
+        cache.get("pvs", loader)
+
+        assert loader.call_count == 2
+
+    def test_shared_block_pins_entries(self):
+        """Inside a shared block each key loads once, then is released."""
+        clock = FakeClock()
+        cache = InventoryCache(ttl_seconds=0, clock=clock)
+        loader = Mock(return_value=[])
+
+        with cache.shared():
+            cache.get("pvs", loader)
+            clock.now = 100
+            cache.get("pvs", loader)
+        assert loader.call_count == 1
+
+        with cache.shared():
+            cache.get("pvs", loader)
+        assert loader.call_count == 2
+
+    def test_shared_block_drops_expired_entries(self):
+        """A shared block does not pin data that was already stale."""
+        clock = FakeClock()
+        cache = InventoryCache(ttl_seconds=10, clock=clock)
+        loader = Mock(side_effect=[["old"], ["new"]])
+
+        cache.get("pvs", loader)
+        clock.now = 11
+        with cache.shared():
+            assert cache.get("pvs", loader) == ["new"]
+
+    def test_keys_are_independent_and_invalidate_clears(self):
+        """Different keys miss separately and invalidate drops everything."""
+        cache = InventoryCache(ttl_seconds=60)
+        loader = Mock(return_value=[])
+
+        cache.get(("pvcs", "a"), loader)
+        cache.get(("pvcs", "b"), loader)
+        cache.get(("pvcs", "a"), loader)
+        assert loader.call_count == 2
+
+        cache.invalidate()
+        cache.get(("pvcs", "a"), loader)
+        assert loader.call_count == 3
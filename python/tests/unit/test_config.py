@@ -175,6 +175,7 @@ class TestConfigClass:
                 "api_key": "secret",
                 "insecure": True,
                 "timeout": "45s",
+                "page_size": 500,
             }
         }
 
@@ -185,6 +186,7 @@ class TestConfigClass:
         assert truenas_config.use_https is True
         assert truenas_config.verify_ssl is False
         assert truenas_config.timeout == 45
+        assert truenas_config.page_size == 500
         assert truenas_config.base_url == "https://truenas.example.com:8443/api/v2.0"
 
     def test_normalize_cluster_config_kubernetes_only(self):
@@ -294,3 +296,30 @@ class TestConfigClass:
         }
         assert config.orphan_threshold == timedelta(hours=48)
         assert config.snapshot_retention == timedelta(days=7)
+
+    def test_inventory_mode_defaults_to_poll(self):
+        """Watch-backed inventory is opt-in."""
+        config = Config.__new__(Config)
+        config.data = {"monitoring": {}}
+        assert config.inventory_mode == "poll"
+
+        config.data = {"monitoring": {"inventory": {"mode": "Watch"}}}
+        assert config.inventory_mode == "watch"
+
+    def test_inventory_mode_rejects_unknown_value(self):
+        """Unknown inventory modes are configuration errors."""
+        config = Config.__new__(Config)
+        config.data = {"monitoring": {"inventory": {"mode": "stream"}}}
+        with pytest.raises(ConfigurationError, match="inventory.mode"):
+            config.inventory_mode
+
+    def test_inventory_cache_ttl(self):
+        """The inventory cache TTL is zero unless performance.cache is enabled."""
+        from datetime import timedelta
+
+        config = Config.__new__(Config)
+        config.data = {"performance": {"cache": {"enabled": False, "ttl": "5m"}}}
+        assert config.inventory_cache_ttl == timedelta(0)
+
+        config.data = {"performance": {"cache": {"enabled": True, "ttl": "5m"}}}
+        assert config.inventory_cache_ttl == timedelta(minutes=5)
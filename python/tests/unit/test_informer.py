@@ -0,0 +1,136 @@
+"""Unit tests for the watch-backed inventory informer."""
+
+import pytest
+from unittest.mock import Mock, patch
+from kubernetes.client.rest import ApiException
+
+from truenas_storage_monitor.informer import InventoryInformer
+from truenas_storage_monitor.k8s_client import K8sClient, K8sConfig
+
+
+def _pvc(name, namespace="test-namespace", phase="Bound", storage_class="democratic-csi-nfs"):
+    pvc = Mock()
+    pvc.metadata.name = name
+    pvc.metadata.namespace = namespace
+    pvc.metadata.creation_timestamp = None
+    pvc.spec.storage_class_name = storage_class
+    pvc.spec.volume_name = f"pv-{name}"
+    pvc.spec.resources.requests = {"storage": "1Gi"}
+    pvc.status.phase = phase
+    return pvc
+
+
+class TestInventoryInformer:
+    """Tests for LIST+WATCH inventory mirroring."""
+
+    @pytest.fixture
+    def k8s(self):
+        """Create K8sClient with mocked Kubernetes API."""
+        with patch("truenas_storage_monitor.k8s_client.config"):
+            with patch("truenas_storage_monitor.k8s_client.k8s_client"):
+                client = K8sClient(
+                    K8sConfig(namespace="test-namespace", storage_class="democratic-csi-nfs")
+                )
+                client.core_v1 = Mock()
+                client.storage_v1 = Mock()
+                client.custom_objects = Mock()
+                return client
+
+    def _run_with_events(self, informer, reflector, events):
+        """Run one reflector synchronously, stopping once events are drained."""
+
+        def stream(*_args, **_kwargs):
+            yield from events
+            informer.stop()
+
+        with patch("truenas_storage_monitor.informer.watch.Watch") as mock_watch:
+            mock_watch.return_value.stream.side_effect = stream
+            mock_watch.return_value.resource_version = "42"
+            reflector.run()
+        return mock_watch
+
+    def test_relist_then_watch_events_update_cache(self, k8s):
+        """Initial LIST seeds the cache and watch events mutate it."""
+        k8s.core_v1.list_namespaced_persistent_volume_claim.return_value = Mock(
+            items=[_pvc("a"), _pvc("b"), _pvc("other", storage_class="other")],
+            metadata=Mock(resource_version="10"),
+        )
+        informer = InventoryInformer(k8s)
+        assert not informer.synced
+
+        mock_watch = self._run_with_events(
+            informer,
+            informer._pvcs,
+            [
+                {"type": "ADDED", "object": _pvc("c", phase="Pending")},
+                {"type": "MODIFIED", "object": _pvc("a", phase="Lost")},
+                {"type": "DELETED", "object": _pvc("b")},
+                {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "12"}}},
+            ],
+        )
+
+        k8s.core_v1.list_namespaced_persistent_volume_claim.assert_called_once_with(
+            resource_version="0", namespace="test-namespace"
+        )
+        _, kwargs = mock_watch.return_value.stream.call_args
+        assert kwargs["resource_version"] == "10"
+        assert kwargs["allow_watch_bookmarks"] is True
+
+        pvcs = {pvc.name: pvc for pvc in informer.persistent_volume_claims()}
+        assert set(pvcs) == {"a", "c"}
+        assert pvcs["a"].phase == "Lost"
+        assert informer._pvcs.synced.is_set()
+
+    def test_expired_watch_triggers_relist(self, k8s):
+        """A 410 Gone from the watch forces a fresh LIST."""
+        k8s.core_v1.list_persistent_volume.return_value = Mock(
+            items=[], metadata=Mock(resource_version="1")
+        )
+        informer = InventoryInformer(k8s)
+        calls = {"count": 0}
+
+        def stream(*_args, **_kwargs):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise ApiException(status=410, reason="Gone")
+            informer.stop()
+            return iter(())
+
+        with patch("truenas_storage_monitor.informer.watch.Watch") as mock_watch:
+            mock_watch.return_value.stream.side_effect = stream
+            mock_watch.return_value.resource_version = None
+            informer._pvs.run()
+
+        assert k8s.core_v1.list_persistent_volume.call_count == 2
+
+    def test_revision_advances_on_inventory_changes(self, k8s):
+        """Relists and watch events bump the revision and wake waiters."""
+        k8s.core_v1.list_namespaced_persistent_volume_claim.return_value = Mock(
+            items=[_pvc("a")], metadata=Mock(resource_version="10")
+        )
+        informer = InventoryInformer(k8s)
+        assert informer.revision == 0
+        assert informer.wait_for_change(0, timeout=0) == 0
+
+        self._run_with_events(
+            informer,
+            informer._pvcs,
+            [
+                {"type": "ADDED", "object": _pvc("b")},
+                {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "11"}}},
+            ],
+        )
+
+        assert informer.revision == 2
+        assert informer.wait_for_change(0, timeout=0) == 2
+
+    def test_covers_namespace_scope(self, k8s):
+        """Namespaced informers only answer queries for their own namespace."""
+        informer = InventoryInformer(k8s)
+        assert informer.covers(None)
+        assert informer.covers("test-namespace")
+        assert not informer.covers("elsewhere")
+
+        k8s.config.namespace = None
+        cluster_informer = InventoryInformer(k8s)
+        assert cluster_informer.covers("elsewhere")
@@ -1,17 +1,25 @@
 """Unit tests for Kubernetes client wrapper."""
 
+import json
+import threading
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 from kubernetes.client.rest import ApiException
 
 from truenas_storage_monitor.k8s_client import (
+    LIST_PAGE_SIZE,
     K8sClient,
     K8sConfig,
     ResourceType,
 )
 
 
+def _page(items, continue_token=None):
+    """Build a LIST response page."""
+    return Mock(items=items, metadata=Mock(_continue=continue_token))
+
+
 class TestK8sConfig:
     """Test K8sConfig validation."""
 
@@ -66,6 +74,19 @@ class TestK8sClient:
                 assert client.config == mock_k8s_config
                 mock_config.load_kube_config.assert_called_once()
 
+    def test_api_groups_share_one_api_client(self, mock_k8s_config):
+        """Core, storage and custom object APIs reuse one connection pool."""
+        with patch("truenas_storage_monitor.k8s_client.config"):
+            with patch("truenas_storage_monitor.k8s_client.k8s_client") as mock_api:
+                client = K8sClient(mock_k8s_config)
+
+        mock_api.ApiClient.assert_called_once_with()
+        shared = mock_api.ApiClient.return_value
+        assert client.api_client is shared
+        mock_api.CoreV1Api.assert_called_once_with(shared)
+        mock_api.StorageV1Api.assert_called_once_with(shared)
+        mock_api.CustomObjectsApi.assert_called_once_with(shared)
+
     def test_client_initialization_in_cluster(self):
         """Test in-cluster client initialization."""
         config = K8sConfig(in_cluster=True)
@@ -90,7 +111,7 @@ class TestK8sClient:
         pv2.metadata.name = "pv-test-2"
         pv2.spec.csi = None  # Non-CSI PV
 
-        mock_client.core_v1.list_persistent_volume.return_value = Mock(items=[pv1, pv2])
+        mock_client.core_v1.list_persistent_volume.return_value = _page([pv1, pv2])
 
         pvs = mock_client.get_persistent_volumes()
 
@@ -99,6 +120,31 @@ class TestK8sClient:
         assert pvs[0].volume_handle == "vol-1"
         assert pvs[0].driver == "org.democratic-csi.nfs"
 
+    def test_get_persistent_volume_claims_follows_continue_token(self, mock_client):
+        """PVC lists are fetched page by page until the continue token runs out."""
+        pvcs = []
+        for name in ("pvc-1", "pvc-2"):
+            pvc = Mock()
+            pvc.metadata.name = name
+            pvc.metadata.namespace = "test-namespace"
+            pvc.spec.storage_class_name = "democratic-csi-nfs"
+            pvcs.append(pvc)
+
+        list_pvcs = mock_client.core_v1.list_namespaced_persistent_volume_claim
+        list_pvcs.side_effect = [_page([pvcs[0]], "next"), _page([pvcs[1]])]
+
+        result = mock_client.get_persistent_volume_claims()
+
+        assert [pvc.name for pvc in result] == ["pvc-1", "pvc-2"]
+        assert list_pvcs.call_args_list[0].kwargs == {
+            "resource_version": "0",
+            "limit": LIST_PAGE_SIZE,
+        }
+        assert list_pvcs.call_args_list[1].kwargs == {
+            "limit": LIST_PAGE_SIZE,
+            "_continue": "next",
+        }
+
     def test_get_persistent_volume_claims(self, mock_client):
         """Test getting persistent volume claims."""
         # Mock PVC objects
@@ -115,8 +161,8 @@ class TestK8sClient:
         pvc2.metadata.name = "pvc-test-2"
         pvc2.spec.storage_class_name = "other-storage"
 
-        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = Mock(
-            items=[pvc1, pvc2]
+        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = _page(
+            [pvc1, pvc2]
         )
 
         pvcs = mock_client.get_persistent_volume_claims()
@@ -124,6 +170,9 @@ class TestK8sClient:
         assert len(pvcs) == 1
         assert pvcs[0].name == "pvc-test-1"
         assert pvcs[0].storage_class == "democratic-csi-nfs"
+        mock_client.core_v1.list_namespaced_persistent_volume_claim.assert_called_once_with(
+            "test-namespace", resource_version="0", limit=LIST_PAGE_SIZE
+        )
 
     def test_get_volume_snapshots(self, mock_client):
         """Test getting volume snapshots."""
@@ -144,9 +193,8 @@ class TestK8sClient:
             },
         }
 
-        mock_client.custom_objects.list_namespaced_custom_object.return_value = {
-            "items": [snapshot1]
-        }
+        response = Mock(data=json.dumps({"items": [snapshot1]}).encode())
+        mock_client.custom_objects.list_namespaced_custom_object.return_value = response
 
         snapshots = mock_client.get_volume_snapshots()
 
@@ -154,6 +202,30 @@ class TestK8sClient:
         assert snapshots[0].name == "snapshot-1"
         assert snapshots[0].source_pvc == "pvc-1"
         assert snapshots[0].ready_to_use is True
+        _, kwargs = mock_client.custom_objects.list_namespaced_custom_object.call_args
+        assert kwargs["_preload_content"] is False
+        response.release_conn.assert_called_once()
+
+    def test_get_volume_snapshots_follows_continue_token(self, mock_client):
+        """VolumeSnapshot lists are fetched page by page until no token is returned."""
+
+        def page(name, continue_token=None):
+            body = {
+                "metadata": {"continue": continue_token} if continue_token else {},
+                "items": [{"metadata": {"name": name, "namespace": "test-namespace"}}],
+            }
+            return Mock(data=json.dumps(body).encode())
+
+        list_snapshots = mock_client.custom_objects.list_namespaced_custom_object
+        list_snapshots.side_effect = [page("snap-1", "next"), page("snap-2")]
+
+        snapshots = mock_client.get_volume_snapshots()
+
+        assert [snapshot.name for snapshot in snapshots] == ["snap-1", "snap-2"]
+        first, second = list_snapshots.call_args_list
+        assert first.kwargs["limit"] == LIST_PAGE_SIZE
+        assert "_continue" not in first.kwargs
+        assert second.kwargs["_continue"] == "next"
 
     def test_get_storage_classes(self, mock_client):
         """Test getting storage classes."""
@@ -219,6 +291,49 @@ class TestK8sClient:
         assert pods[0]["name"] == "democratic-csi-controller-0"
         assert pods[0]["status"] == "Running"
 
+    def test_get_csi_driver_pods_queries_selectors_concurrently(self, mock_client):
+        """Label selector queries are in flight together and results deduplicated."""
+        barrier = threading.Barrier(2, timeout=5)
+        pod1 = Mock()
+        pod1.metadata.name = "democratic-csi-node-0"
+        pod1.metadata.namespace = "democratic-csi"
+        pod1.status.container_statuses = []
+
+        def list_pods(label_selector):
+            barrier.wait()
+            return Mock(items=[pod1])
+
+        mock_client.core_v1.list_pod_for_all_namespaces.side_effect = list_pods
+
+        pods = mock_client.get_csi_driver_pods()
+
+        assert [pod["name"] for pod in pods] == ["democratic-csi-node-0"]
+        selectors = [
+            call.kwargs["label_selector"]
+            for call in mock_client.core_v1.list_pod_for_all_namespaces.call_args_list
+        ]
+        assert sorted(selectors) == [
+            "app in (org.democratic-csi.nfs,democratic-csi)",
+            "app.kubernetes.io/name in (org.democratic-csi.nfs,democratic-csi)",
+        ]
+
+    @pytest.mark.parametrize("driver", ["truenas/nfs", "x" * 64, ""])
+    def test_get_csi_driver_pods_skips_invalid_driver_label(self, mock_client, driver):
+        """A driver name that is not a label value keeps the democratic-csi selectors."""
+        mock_client.config.csi_driver = driver
+        mock_client.core_v1.list_pod_for_all_namespaces.return_value = Mock(items=[])
+
+        mock_client.get_csi_driver_pods()
+
+        selectors = [
+            call.kwargs["label_selector"]
+            for call in mock_client.core_v1.list_pod_for_all_namespaces.call_args_list
+        ]
+        assert sorted(selectors) == [
+            "app in (democratic-csi)",
+            "app.kubernetes.io/name in (democratic-csi)",
+        ]
+
     def test_check_csi_driver_health(self, mock_client):
         """Test checking CSI driver health."""
         # Mock healthy pods
@@ -263,7 +378,7 @@ class TestK8sClient:
         pv1.spec.claim_ref = None
         pv1.status.phase = "Available"
 
-        mock_client.core_v1.list_persistent_volume.return_value = Mock(items=[pv1])
+        mock_client.core_v1.list_persistent_volume.return_value = _page([pv1])
 
         orphans = mock_client.find_orphaned_pvs()
 
@@ -282,9 +397,7 @@ class TestK8sClient:
         pvc1.spec.storage_class_name = "democratic-csi-nfs"
         pvc1.status.phase = "Pending"
 
-        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = Mock(
-            items=[pvc1]
-        )
+        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = _page([pvc1])
 
         orphans = mock_client.find_orphaned_pvcs(pending_threshold_minutes=60)
 
@@ -294,7 +407,7 @@ class TestK8sClient:
 
     def test_find_orphaned_pvcs_empty_list(self, mock_client):
         """Empty PVC list does not raise during orphan detection."""
-        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = Mock(items=[])
+        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = _page([])
 
         orphans = mock_client.find_orphaned_pvcs(pending_threshold_minutes=60)
 
@@ -309,9 +422,7 @@ class TestK8sClient:
         pvc1.spec.storage_class_name = "democratic-csi-nfs"
         pvc1.status.phase = "Pending"
 
-        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = Mock(
-            items=[pvc1]
-        )
+        mock_client.core_v1.list_namespaced_persistent_volume_claim.return_value = _page([pvc1])
 
         orphans = mock_client.find_orphaned_pvcs(pending_threshold_minutes=60)
 
@@ -1,5 +1,8 @@
 """Unit tests for the Monitor class."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta, timezone
@@ -12,7 +15,48 @@ from truenas_storage_monitor.k8s_client import (
     PersistentVolumeClaimInfo,
     PersistentVolumeInfo,
 )
-from truenas_storage_monitor.truenas_client import TrueNASConfig, VolumeInfo
+from truenas_storage_monitor.truenas_client import SnapshotInfo, TrueNASConfig, VolumeInfo
+
+
+def _pending_pvc(name):
+    """A claim stuck in Pending well past the orphan threshold."""
+    return PersistentVolumeClaimInfo(
+        name=name,
+        namespace="default",
+        storage_class="truenas-iscsi",
+        volume_name=None,
+        capacity="5Gi",
+        phase="Pending",
+        creation_time=utc_now() - timedelta(hours=25),
+    )
+
+
+class _FakeClock:
+    """Stand-in for the ``time`` module whose clock only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+class _RecordingEvent(threading.Event):
+    """Stop event whose waits return immediately and record their timeouts.
+
+    When given a fake clock, each wait advances it by the timeout.
+    """
+
+    def __init__(self, clock=None):
+        super().__init__()
+        self.waits = []
+        self.clock = clock
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        if self.clock is not None and timeout is not None:
+            self.clock.now += timeout
+        return self.is_set()
 
 
 class TestMonitor:
@@ -31,6 +75,8 @@ class TestMonitor:
         config.orphan_threshold = timedelta(hours=24)
         config.snapshot_retention = timedelta(days=30)
         config.metrics_enabled = False
+        config.inventory_mode = "poll"
+        config.inventory_cache_ttl = timedelta(0)
         return config
 
     @pytest.fixture
@@ -42,11 +88,10 @@ class TestMonitor:
         ):
             mock_k8s_cls.return_value = Mock()
             mock_truenas_cls.return_value = Mock()
-            monitor = Monitor(mock_config)
-            return monitor
+            yield Monitor(mock_config)
 
     def test_monitor_initialization(self, mock_config):
-        """Test that Monitor initializes with typed client configs."""
+        """Test that Monitor builds each client lazily from its typed config."""
         with (
             patch("truenas_storage_monitor.monitor.K8sClient") as mock_k8s,
             patch("truenas_storage_monitor.monitor.TrueNASClient") as mock_truenas,
@@ -54,9 +99,16 @@ class TestMonitor:
             monitor = Monitor(mock_config)
 
             assert monitor.config == mock_config
+            mock_k8s.assert_not_called()
+            mock_truenas.assert_not_called()
+
+            assert monitor.k8s_client is monitor.k8s_client
             mock_config.k8s_config.assert_called_once()
-            mock_config.truenas_config.assert_called_once()
             mock_k8s.assert_called_once_with(mock_config.k8s_config.return_value)
+            mock_truenas.assert_not_called()
+
+            assert monitor.truenas_client is mock_truenas.return_value
+            mock_config.truenas_config.assert_called_once()
             mock_truenas.assert_called_once_with(mock_config.truenas_config.return_value)
 
     def test_find_orphaned_resources_success(self, monitor):
@@ -106,6 +158,198 @@ class TestMonitor:
         assert "phase_timings" in result
         assert "k8s_pvs" in result["phase_timings"]
 
+    def test_find_orphaned_resources_fetches_inventory_concurrently(self, monitor):
+        """All five inventory lists are in flight at the same time."""
+        barrier = threading.Barrier(5, timeout=5)
+
+        def fetch(result):
+            def _fetch(*_args, **_kwargs):
+                barrier.wait()
+                return result
+
+            return _fetch
+
+        monitor.k8s_client.get_persistent_volumes.side_effect = fetch([])
+        monitor.k8s_client.get_persistent_volume_claims.side_effect = fetch([])
+        monitor.k8s_client.get_volume_snapshots.side_effect = fetch([])
+        monitor.truenas_client.get_volumes.side_effect = fetch([])
+        monitor.truenas_client.get_snapshots.side_effect = fetch([])
+
+        result = monitor.find_orphaned_resources()
+
+        assert set(result["phase_timings"]) == {
+            "k8s_pvs",
+            "k8s_pvcs",
+            "k8s_snapshots",
+            "truenas_datasets",
+            "truenas_snapshots",
+        }
+
+    def test_watch_inventory_mode_reads_from_informer(self, mock_config):
+        """Watch mode serves Kubernetes inventory from the synced informer."""
+        mock_config.inventory_mode = "watch"
+        with (
+            patch("truenas_storage_monitor.monitor.K8sClient"),
+            patch("truenas_storage_monitor.monitor.TrueNASClient"),
+            patch("truenas_storage_monitor.monitor.InventoryInformer") as mock_informer_cls,
+        ):
+            monitor = Monitor(mock_config)
+
+            informer = mock_informer_cls.return_value
+            informer.start.assert_called_once()
+            informer.synced = True
+            informer.covers.return_value = True
+            informer.persistent_volumes.return_value = []
+            informer.persistent_volume_claims.return_value = []
+            informer.volume_snapshots.return_value = []
+            monitor.truenas_client.get_volumes.return_value = []
+            monitor.truenas_client.get_snapshots.return_value = []
+
+            result = monitor.find_orphaned_resources()
+
+            assert result["total_pvs"] == 0
+            monitor.k8s_client.get_persistent_volumes.assert_not_called()
+            monitor.k8s_client.get_persistent_volume_claims.assert_not_called()
+            monitor.k8s_client.get_volume_snapshots.assert_not_called()
+
+            informer.synced = False
+            monitor.k8s_client.get_persistent_volumes.return_value = []
+            monitor.k8s_client.get_persistent_volume_claims.return_value = []
+            monitor.k8s_client.get_volume_snapshots.return_value = []
+            monitor.find_orphaned_resources()
+            monitor.k8s_client.get_persistent_volumes.assert_called_once()
+
+            monitor.close()
+            informer.stop.assert_called_once()
+
+    def test_watch_orphaned_resources_yields_deltas(self, monitor):
+        """The orphan feed reports only orphans that appeared or were resolved."""
+        monitor.k8s_client.get_persistent_volumes.return_value = []
+        monitor.k8s_client.get_persistent_volume_claims.return_value = [_pending_pvc("a")]
+        monitor.k8s_client.get_volume_snapshots.return_value = []
+        monitor.truenas_client.get_volumes.return_value = []
+        monitor.truenas_client.get_snapshots.return_value = []
+
+        feed = monitor.watch_orphaned_resources(resync_seconds=0)
+
+        first = next(feed)
+        assert [pvc["name"] for pvc in first["added"]["orphaned_pvcs"]] == ["a"]
+        assert first["resolved"] == {
+            "orphaned_pvs": [],
+            "orphaned_pvcs": [],
+            "orphaned_snapshots": [],
+        }
+
+        monitor.k8s_client.get_persistent_volume_claims.return_value = [_pending_pvc("b")]
+        second = next(feed)
+        assert [pvc["name"] for pvc in second["added"]["orphaned_pvcs"]] == ["b"]
+        assert [pvc["name"] for pvc in second["resolved"]["orphaned_pvcs"]] == ["a"]
+        feed.close()
+
+    def _stub_inventory(self, monitor):
+        monitor.k8s_client.get_persistent_volumes.return_value = []
+        monitor.k8s_client.get_persistent_volume_claims.return_value = [_pending_pvc("a")]
+        monitor.k8s_client.get_volume_snapshots.return_value = []
+        monitor.truenas_client.get_volumes.return_value = []
+        monitor.truenas_client.get_snapshots.return_value = []
+
+    def _attach_informer(self, monitor, wait_for_change):
+        informer = Mock()
+        informer.synced = False
+        informer.revision = 0
+        informer.wait_for_change.side_effect = wait_for_change
+        monitor._informer = informer
+        return informer
+
+    def test_watch_orphaned_resources_stops_promptly(self, monitor):
+        """Setting the stop event ends a feed blocked on a quiet informer."""
+        self._stub_inventory(monitor)
+
+        def quiet(revision, timeout):
+            time.sleep(timeout)
+            return revision
+
+        informer = self._attach_informer(monitor, quiet)
+        stop_event = threading.Event()
+        feed = monitor.watch_orphaned_resources(stop_event=stop_event)
+        next(feed)
+
+        threading.Timer(0.1, stop_event.set).start()
+        started = time.monotonic()
+        with pytest.raises(StopIteration):
+            next(feed)
+
+        assert time.monotonic() - started < 5
+        assert all(call.args[1] <= 1.0 for call in informer.wait_for_change.call_args_list)
+
+    def test_watch_orphaned_resources_rate_limits_event_rescans(self, monitor):
+        """Constant informer churn rescans no faster than min_rescan_seconds."""
+        self._stub_inventory(monitor)
+        self._attach_informer(monitor, lambda revision, timeout: revision + 1)
+        clock = _FakeClock()
+        stop_event = _RecordingEvent(clock)
+        with patch("truenas_storage_monitor.monitor.time", clock):
+            feed = monitor.watch_orphaned_resources(
+                settle_seconds=0, min_rescan_seconds=30, stop_event=stop_event
+            )
+            next(feed)
+
+            monitor.k8s_client.get_persistent_volume_claims.return_value = [_pending_pvc("b")]
+            next(feed)
+            feed.close()
+
+        assert stop_event.waits == [30]
+        assert monitor.truenas_client.get_volumes.call_count == 2
+
+    def test_watch_orphaned_resources_survives_failed_scan(self, monitor):
+        """A failed scan is logged and retried instead of ending the feed."""
+        self._stub_inventory(monitor)
+        monitor.truenas_client.get_volumes.side_effect = [Exception("TrueNAS unavailable"), []]
+        stop_event = _RecordingEvent()
+
+        feed = monitor.watch_orphaned_resources(stop_event=stop_event)
+        first = next(feed)
+        feed.close()
+
+        assert [pvc["name"] for pvc in first["added"]["orphaned_pvcs"]] == ["a"]
+        assert monitor.truenas_client.get_volumes.call_count == 2
+        assert stop_event.waits == [1.0]
+
+    def test_watch_orphaned_resources_keys_truenas_snapshots_by_full_name(self, monitor):
+        """Same-named snapshots on different datasets are tracked separately."""
+
+        def auto_daily(dataset):
+            return SnapshotInfo(
+                name="auto-daily",
+                dataset=dataset,
+                creation_time=utc_now() - timedelta(days=60),
+                used_size=0,
+                referenced_size=0,
+                full_name=f"{dataset}@auto-daily",
+            )
+
+        snapshots = [auto_daily(f"tank/k8s/volumes/pvc-{i}") for i in range(3)]
+        monitor.k8s_client.get_persistent_volumes.return_value = []
+        monitor.k8s_client.get_persistent_volume_claims.return_value = []
+        monitor.k8s_client.get_volume_snapshots.return_value = []
+        monitor.truenas_client.get_volumes.return_value = []
+        monitor.truenas_client.get_snapshots.return_value = snapshots
+
+        feed = monitor.watch_orphaned_resources(resync_seconds=0)
+        first = next(feed)
+        assert sorted(s["full_name"] for s in first["added"]["orphaned_snapshots"]) == [
+            snapshot.full_name for snapshot in snapshots
+        ]
+
+        monitor.truenas_client.get_snapshots.return_value = snapshots[:1]
+        second = next(feed)
+        feed.close()
+
+        assert second["added"]["orphaned_snapshots"] == []
+        assert sorted(s["full_name"] for s in second["resolved"]["orphaned_snapshots"]) == [
+            snapshot.full_name for snapshot in snapshots[1:]
+        ]
+
     def test_find_orphaned_resources_naive_creation_time(self, monitor):
         """Naive creation timestamps do not raise TypeError."""
         naive_created = datetime(2020, 1, 1, 0, 0, 0)
@@ -180,6 +424,15 @@ class TestMonitor:
         assert monitor._parse_storage_size("1024") == 1024
         assert monitor._parse_storage_size("") == 0
         assert monitor._parse_storage_size("invalid") == 0
+        assert monitor._parse_storage_size("2Pi") == 2 * 1024**5
+        assert monitor._parse_storage_size("1Ei") == 1024**6
+        assert monitor._parse_storage_size("1.5Gi") == 3 * 1024**3 // 2
+        assert monitor._parse_storage_size("abcGi") == 0
+        assert monitor._parse_storage_size(".5Gi") == 1024**3 // 2
+        assert monitor._parse_storage_size("+1Gi") == 1024**3
+        assert monitor._parse_storage_size("+.5Mi") == 1024**2 // 2
+        assert monitor._parse_storage_size("-1Gi") == 0
+        assert monitor._parse_storage_size(".Gi") == 0
 
     def test_analyze_storage_usage(self, monitor):
         """Test storage usage analysis."""
@@ -265,6 +518,116 @@ class TestMonitor:
         assert result["components"]["truenas"]["healthy"] is True
         assert result["components"]["csi_driver"]["healthy"] is False
 
+    def test_check_health_probes_concurrently(self, monitor):
+        """The three health probes are in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def probe(result):
+            def _probe(*_args, **_kwargs):
+                barrier.wait()
+                return result
+
+            return _probe
+
+        monitor.k8s_client.test_connection.side_effect = probe(True)
+        monitor.truenas_client.test_connection.side_effect = probe(True)
+        monitor.k8s_client.check_csi_driver_health.side_effect = probe({"healthy": True})
+
+        result = monitor.check_health()
+
+        assert result["healthy"] is True
+        assert list(result["components"]) == ["kubernetes", "truenas", "csi_driver"]
+
+    def test_generate_report_lists_shared_inventory_once(self, monitor):
+        """A report fetches each inventory list once across its scans."""
+        monitor.k8s_client.get_persistent_volumes.return_value = []
+        monitor.k8s_client.get_persistent_volume_claims.return_value = []
+        monitor.k8s_client.get_volume_snapshots.return_value = []
+        monitor.truenas_client.get_volumes.return_value = []
+        monitor.truenas_client.get_snapshots.return_value = []
+        monitor.k8s_client.check_csi_driver_health.return_value = {"healthy": True}
+
+        monitor.generate_report()
+
+        monitor.k8s_client.get_persistent_volumes.assert_called_once()
+        monitor.k8s_client.get_persistent_volume_claims.assert_called_once()
+        monitor.truenas_client.get_volumes.assert_called_once()
+
+        monitor.generate_report()
+
+        assert monitor.k8s_client.get_persistent_volumes.call_count == 2
+
+    def test_connection_probes_cached_within_ttl(self, mock_config):
+        """Successful connection probes are reused; failures are probed again."""
+        mock_config.inventory_cache_ttl = timedelta(seconds=60)
+        with (
+            patch("truenas_storage_monitor.monitor.K8sClient"),
+            patch("truenas_storage_monitor.monitor.TrueNASClient"),
+        ):
+            monitor = Monitor(mock_config)
+            monitor.k8s_client.test_connection.return_value = True
+            monitor.k8s_client.list_namespaces.return_value = ["democratic-csi"]
+            monitor.k8s_client.check_csi_driver_health.return_value = {"healthy": True}
+            monitor.truenas_client.test_connection.side_effect = Exception("unreachable")
+
+            validation = monitor.validate_configuration()
+            health = monitor.check_health()
+
+            assert validation["kubernetes"]["valid"] is True
+            assert health["components"]["truenas"]["healthy"] is False
+            monitor.k8s_client.test_connection.assert_called_once()
+            assert monitor.truenas_client.test_connection.call_count == 2
+
+    def test_generate_report_runs_scans_concurrently(self, monitor):
+        """The orphan scan and the health check are in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def list_snapshots():
+            barrier.wait()
+            return []
+
+        def csi_health():
+            barrier.wait()
+            return {"healthy": True}
+
+        monitor.k8s_client.get_persistent_volumes.return_value = []
+        monitor.k8s_client.get_persistent_volume_claims.return_value = []
+        monitor.k8s_client.get_volume_snapshots.return_value = []
+        monitor.truenas_client.get_volumes.return_value = []
+        monitor.truenas_client.get_snapshots.side_effect = list_snapshots
+        monitor.k8s_client.check_csi_driver_health.side_effect = csi_health
+
+        report = monitor.generate_report()
+
+        assert report["summary"]["total_orphaned_resources"] == 0
+        assert report["health_check"]["components"]["csi_driver"]["healthy"] is True
+
+    def test_cached_inventory_reused_until_invalidated(self, mock_config):
+        """With a cache TTL, repeated scans reuse every list until invalidated."""
+        mock_config.inventory_cache_ttl = timedelta(seconds=60)
+        with (
+            patch("truenas_storage_monitor.monitor.K8sClient"),
+            patch("truenas_storage_monitor.monitor.TrueNASClient"),
+        ):
+            monitor = Monitor(mock_config)
+            monitor.k8s_client.get_persistent_volumes.return_value = []
+            monitor.k8s_client.get_persistent_volume_claims.return_value = []
+            monitor.k8s_client.get_volume_snapshots.return_value = []
+            monitor.truenas_client.get_volumes.return_value = []
+            monitor.truenas_client.get_snapshots.return_value = []
+
+            monitor.find_orphaned_resources()
+            monitor.find_orphaned_resources()
+
+            monitor.k8s_client.get_volume_snapshots.assert_called_once()
+            monitor.truenas_client.get_snapshots.assert_called_once()
+
+            monitor.invalidate_inventory()
+            monitor.find_orphaned_resources()
+
+            assert monitor.k8s_client.get_volume_snapshots.call_count == 2
+            assert monitor.truenas_client.get_snapshots.call_count == 2
+
     def test_generate_recommendations(self, monitor):
         """Test recommendation generation."""
         mock_pvcs = [
@@ -302,3 +665,27 @@ class TestMonitor:
 def utc_now():
     """Local helper mirroring production UTC helper."""
     return datetime.now(timezone.utc)
+
+
+class TestSubstringIndex:
+    """The prebuilt matcher agrees with the pairwise substring scan."""
+
+    def test_matches_equivalent_to_pairwise_scan(self):
+        """Randomized names produce the same answers as the brute-force loop."""
+        import random
+
+        from truenas_storage_monitor.monitor import _SubstringIndex
+
+        rng = random.Random(1234)
+        alphabet = "ab-/"
+
+        def word(max_len):
+            return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+
+        for _ in range(200):
+            names = [word(6) for _ in range(rng.randint(0, 5))]
+            index = _SubstringIndex(names)
+            for _ in range(10):
+                query = word(8)
+                expected = any(name in query or query in name for name in names)
+                assert index.matches(query) is expected, (names, query)
@@ -1,5 +1,7 @@
 """Unit tests for observability helpers."""
 
+from unittest.mock import Mock
+
 from truenas_storage_monitor.observability import ScanObservability
 
 
@@ -27,6 +29,25 @@ class TestScanObservability:
             pass
         obs.finish_scan()
 
+    def test_finish_scan_records_metrics_in_one_batch(self, monkeypatch):
+        """Scan and phase durations are handed to the metrics backend together."""
+        metrics = Mock()
+        monkeypatch.setattr(
+            "truenas_storage_monitor.observability._get_metrics_registry",
+            lambda: metrics,
+        )
+        obs = ScanObservability(metrics_enabled=True)
+        obs.begin_scan()
+        with obs.phase("k8s_pvs"):
+            pass
+        with obs.phase("truenas_datasets"):
+            pass
+        duration = obs.finish_scan()
+
+        metrics.observe_scan_phases.assert_called_once_with(duration, obs.phase_timings)
+        metrics.observe_scan.assert_not_called()
+        metrics.observe_list_phase.assert_not_called()
+
     def test_begin_scan_disables_metrics_when_prometheus_missing(self, monkeypatch):
         """Missing prometheus_client disables metrics instead of crashing."""
 
@@ -41,3 +62,32 @@ class TestScanObservability:
         obs.begin_scan()
         assert obs.metrics_enabled is False
         assert obs._metrics is None
+
+
+class TestScanMetrics:
+    """Tests for the optional Prometheus backend."""
+
+    def test_unknown_phase_is_bucketed_as_other(self):
+        """Unexpected phase names cannot create new label values."""
+        from prometheus_client import REGISTRY
+
+        from truenas_storage_monitor.prometheus_metrics import ScanMetrics
+
+        def count(phase):
+            return (
+                REGISTRY.get_sample_value(
+                    "truenas_python_list_duration_seconds_count", {"phase": phase}
+                )
+                or 0
+            )
+
+        before_other = count("other")
+        ScanMetrics().observe_scan_phases(1.0, {"k8s_pvs": 0.1, "unexpected-phase": 0.2})
+
+        assert count("other") == before_other + 1
+        assert (
+            REGISTRY.get_sample_value(
+                "truenas_python_list_duration_seconds_count", {"phase": "unexpected-phase"}
+            )
+            is None
+        )
@@ -0,0 +1,224 @@
+"""Unit tests for the shared JSON schema validator."""
+
+import importlib.util
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+SCHEMA_DIR = Path(__file__).resolve().parents[3] / "shared" / "schemas"
+
+_spec = importlib.util.spec_from_file_location(
+    "shared_schema_validator", SCHEMA_DIR / "validator.py"
+)
+schema_validator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(schema_validator)
+
+SchemaValidator = schema_validator.SchemaValidator
+
+# Empty resources and missing report fields yield dozens of errors
+_INVALID_REPORT = {"orphaned_resources": [{}] * 10}
+
+
+class TestValidate:
+    """Tests for error collection in SchemaValidator.validate."""
+
+    def test_collects_every_error_by_default(self):
+        """Without a cap every error is reported."""
+        errors = SchemaValidator().validate(_INVALID_REPORT, "orphaned-resources")
+        assert len(errors) > 10
+
+    def test_max_errors_caps_collection(self):
+        """A positive cap stops after that many errors."""
+        validator = SchemaValidator()
+        errors = validator.validate(_INVALID_REPORT, "orphaned-resources", max_errors=3)
+        assert errors == validator.validate(_INVALID_REPORT, "orphaned-resources")[:3]
+
+    def test_max_errors_none_is_unlimited(self):
+        """None behaves like the default and collects everything."""
+        validator = SchemaValidator()
+        assert validator.validate(
+            _INVALID_REPORT, "orphaned-resources", max_errors=None
+        ) == validator.validate(_INVALID_REPORT, "orphaned-resources")
+
+    @pytest.mark.parametrize("max_errors", [0, -1])
+    def test_max_errors_below_one_rejected(self, max_errors):
+        """A cap that would hide every error is refused."""
+        with pytest.raises(ValueError, match="max_errors"):
+            SchemaValidator().validate(_INVALID_REPORT, "orphaned-resources", max_errors=max_errors)
+
+
+def _orphan_report(resource):
+    """Wrap one orphaned resource in a minimal report."""
+    return {
+        "timestamp": "2024-01-01T00:00:00Z",
+        "summary": {"total_orphans": 1},
+        "orphaned_resources": [resource],
+    }
+
+
+class TestCreateOrphanedResource:
+    """Tests for create_orphaned_resource."""
+
+    def test_round_trips_through_schema(self):
+        """A fully populated entry validates against the orphan report schema."""
+        resource = schema_validator.create_orphaned_resource(
+            "PersistentVolume",
+            "pv-1",
+            "Kubernetes",
+            "No bound claim",
+            "2024-01-01T00:00:00Z",
+            namespace="default",
+            volume_handle="tank/k8s/pv-1",
+            size_bytes=1024,
+            safe=True,
+            pool="tank",
+        )
+
+        assert SchemaValidator().validate_orphaned_resources(_orphan_report(resource)) == []
+        assert resource["remediation"] == {"action": "manual_review", "safe": True}
+        assert resource["details"] == {"pool": "tank"}
+
+    def test_none_fields_are_omitted(self):
+        """Fields passed as None are left out rather than emitted as null."""
+        resource = schema_validator.create_orphaned_resource(
+            "TrueNASVolume",
+            "vol-1",
+            None,
+            None,
+            None,
+            remediation_action=None,
+        )
+
+        assert list(resource) == ["type", "name", "remediation", "details"]
+        assert resource["remediation"] == {"safe": False}
+        errors = SchemaValidator().validate_orphaned_resources(_orphan_report(resource))
+        assert all("None is not of type" not in error for error in errors)
+
+
+def _analysis_report(alert):
+    """Wrap one alert in a minimal storage analysis report."""
+    return {
+        "timestamp": "2024-01-01T00:00:00Z",
+        "storage_summary": {
+            "total_capacity_bytes": 100,
+            "total_allocated_bytes": 50,
+            "total_used_bytes": 25,
+        },
+        "alerts": [alert],
+    }
+
+
+class TestCreateStorageAlert:
+    """Tests for create_storage_alert."""
+
+    def test_details_omitted_when_empty(self):
+        """Alerts without extra fields carry no details key and still validate."""
+        alert = schema_validator.create_storage_alert("warning", "capacity", "Pool nearly full")
+
+        assert alert == {"level": "warning", "category": "capacity", "message": "Pool nearly full"}
+        assert SchemaValidator().validate_storage_analysis(_analysis_report(alert)) == []
+
+    def test_details_and_optional_fields_included_when_set(self):
+        """Extra fields land under details and set optionals are kept."""
+        alert = schema_validator.create_storage_alert(
+            "critical", "capacity", "Pool full", resource="tank", threshold=0.9, pool="tank"
+        )
+
+        assert alert["resource"] == "tank"
+        assert alert["threshold"] == 0.9
+        assert "current_value" not in alert
+        assert alert["details"] == {"pool": "tank"}
+        assert SchemaValidator().validate_storage_analysis(_analysis_report(alert)) == []
+
+
+@pytest.fixture
+def schema_copy(tmp_path):
+    """Copy the bundled schema files into a fresh directory."""
+    for path in SCHEMA_DIR.glob("*.json"):
+        (tmp_path / path.name).write_bytes(path.read_bytes())
+    return tmp_path
+
+
+class TestSchemaLoading:
+    """Tests for lazy loading and sharing of compiled schemas."""
+
+    def test_schema_loaded_on_first_validate(self, schema_copy):
+        """Construction reads nothing and validate loads only its schema."""
+        validator = SchemaValidator(schema_copy)
+        orphans_path = (schema_copy / "orphaned-resources.json").resolve()
+        assert orphans_path not in schema_validator._COMPILED
+
+        validator.validate({}, "orphaned-resources")
+
+        assert orphans_path in schema_validator._COMPILED
+        assert set(validator._validators) == {"orphaned-resources"}
+
+    def test_schemas_property_loads_every_schema(self, schema_copy):
+        """Reading schemas still exposes all bundled schemas."""
+        schemas = SchemaValidator(schema_copy).schemas
+
+        assert set(schemas) == {"orphaned-resources", "storage-analysis", "config-validation"}
+        assert schemas["orphaned-resources"]["title"] == "Orphaned Resources Report"
+
+    def test_unknown_schema_reported(self):
+        """Unknown names are reported as an error and never valid."""
+        validator = SchemaValidator()
+
+        assert validator.validate({}, "no-such-schema") == ["Unknown schema: no-such-schema"]
+        assert not validator.is_valid({}, "no-such-schema")
+
+    def test_missing_schema_file_reported(self, tmp_path):
+        """A known name whose file is absent is reported like an unknown one."""
+        validator = SchemaValidator(tmp_path)
+
+        assert validator.validate({}, "storage-analysis") == ["Unknown schema: storage-analysis"]
+        assert "storage-analysis" not in validator.schemas
+
+    def test_compiled_validator_shared_across_instances(self):
+        """Instances over the same directory reuse one compiled validator."""
+        first = SchemaValidator()._get_validator("storage-analysis")
+        second = SchemaValidator()._get_validator("storage-analysis")
+
+        assert first is second
+        assert schema_validator.get_default_validator() is schema_validator.get_default_validator()
+
+    def test_identical_schema_content_compiled_once(self, schema_copy):
+        """A copy of a schema elsewhere on disk reuses the same validator."""
+        bundled = SchemaValidator()._get_validator("config-validation")
+        copied = SchemaValidator(schema_copy)._get_validator("config-validation")
+
+        assert copied is bundled
+
+    def test_concurrent_first_use_compiles_once(self, tmp_path, monkeypatch):
+        """Threads racing on a new schema share a single compilation."""
+        schema = json.loads((SCHEMA_DIR / "storage-analysis.json").read_text())
+        schema["$comment"] = str(tmp_path)
+        (tmp_path / "storage-analysis.json").write_text(json.dumps(schema))
+
+        compiled = []
+
+        class CountingValidator(schema_validator.Draft7Validator):
+            def __init__(self, *args, **kwargs):
+                compiled.append(self)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(schema_validator, "Draft7Validator", CountingValidator)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def first_use():
+            validator = SchemaValidator(tmp_path)
+            barrier.wait()
+            results.append(validator._get_validator("storage-analysis"))
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(compiled) == 1
+        assert len(results) == 8
+        assert all(result is compiled[0] for result in results)
@@ -1,10 +1,16 @@
 """Unit tests for timezone helpers."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from truenas_storage_monitor.time_utils import ensure_utc, parse_rfc3339, resource_age, utc_now
+from truenas_storage_monitor.time_utils import (
+    ensure_utc,
+    format_age,
+    parse_rfc3339,
+    resource_age,
+    utc_now,
+)
 
 
 class TestTimeUtils:
@@ -29,6 +35,18 @@ class TestTimeUtils:
         result = ensure_utc(aware)
         assert result.tzinfo == timezone.utc
 
+    def test_ensure_utc_returns_utc_datetime_unchanged(self):
+        """Datetimes already in UTC are passed through without conversion."""
+        aware = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert ensure_utc(aware) is aware
+
+    def test_ensure_utc_from_other_offset(self):
+        """Datetimes with another offset are converted to UTC."""
+        aware = datetime(2024, 1, 1, 14, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+        result = ensure_utc(aware)
+        assert result.tzinfo is timezone.utc
+        assert result.hour == 12
+
     def test_parse_rfc3339_with_z_suffix(self):
         """RFC3339 timestamps with Z suffix parse to aware UTC."""
         parsed = parse_rfc3339("2024-06-01T10:15:30Z")
@@ -56,3 +74,16 @@ class TestTimeUtils:
         age = resource_age(created)
         assert age is not None
         assert "0:00:" in age
+
+    def test_resource_age_uses_reference_time(self):
+        """resource_age measures against an explicit reference time."""
+        created = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 1, 2, 1, 0, 0, 250000, tzinfo=timezone.utc)
+        assert resource_age(created, now) == "1 day, 1:00:00"
+
+    def test_format_age_matches_timedelta_format(self):
+        """format_age renders whole seconds the way timedelta does."""
+        from datetime import timedelta
+
+        for seconds in (0, 59, 3600, 86399, 86400, 2 * 86400 + 3723, -1, -86401):
+            assert format_age(seconds) == str(timedelta(seconds=seconds))
@@ -1,5 +1,9 @@
 """Unit tests for TrueNAS client."""
 
+import json
+import threading
+from datetime import datetime
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -8,9 +12,17 @@ from truenas_storage_monitor.truenas_client import (
     TrueNASConfig,
     TrueNASError,
     AuthenticationError,
+    VolumeInfo,
+    _quote_snapshot_id,
+    _shared_adapter,
 )
 
 
+def _json_body(payload):
+    """Encode a payload the way TrueNAS returns it on the wire."""
+    return json.dumps(payload).encode()
+
+
 class TestTrueNASConfig:
     """Test TrueNASConfig validation."""
 
@@ -54,6 +66,12 @@ class TestTrueNASConfig:
         with pytest.raises(ValueError, match="Either api_key or username/password"):
             TrueNASConfig(host="truenas.example.com")
 
+    @pytest.mark.parametrize("page_size", [0, -50])
+    def test_config_validation_page_size(self, page_size):
+        """Page sizes below one are rejected."""
+        with pytest.raises(ValueError, match="page_size must be at least 1"):
+            TrueNASConfig(host="truenas.example.com", api_key="k", page_size=page_size)
+
 
 class TestTrueNASClient:
     """Test TrueNASClient functionality."""
@@ -83,11 +101,66 @@ class TestTrueNASClient:
             assert client.config == mock_config
             assert client.base_url == "https://truenas.example.com:443/api/v2.0"
 
+    def test_adapter_pool_sized_for_concurrent_requests(self, mock_config):
+        """The mounted adapter keeps more than the default 10 connections."""
+        _shared_adapter.cache_clear()
+        with patch("truenas_storage_monitor.truenas_client.requests.Session"):
+            with patch("truenas_storage_monitor.truenas_client._SharedHTTPAdapter") as mock_adapter:
+                TrueNASClient(mock_config)
+        _shared_adapter.cache_clear()
+
+        _, kwargs = mock_adapter.call_args
+        assert kwargs["pool_maxsize"] == 32
+
+    def test_retry_policy_jitters_and_retries_throttling(self, mock_config):
+        """Retries back off with jitter and cover 429 responses."""
+        _shared_adapter.cache_clear()
+        with patch("truenas_storage_monitor.truenas_client.requests.Session"):
+            with patch("truenas_storage_monitor.truenas_client._SharedHTTPAdapter") as mock_adapter:
+                TrueNASClient(mock_config)
+        _shared_adapter.cache_clear()
+
+        retry = mock_adapter.call_args.kwargs["max_retries"]
+        assert 429 in retry.status_forcelist
+        assert retry.respect_retry_after_header is True
+
+        retry = retry.increment(method="GET", url="/pool").increment(method="GET", url="/pool")
+        with patch("truenas_storage_monitor.truenas_client.random.uniform", return_value=1.5):
+            assert retry.get_backoff_time() == pytest.approx(0.6 * 1.5)
+
+    def test_clients_of_one_host_share_connection_pool(self, mock_config):
+        """Clients with different credentials reuse one adapter but keep their own auth."""
+        other = TrueNASClient(
+            TrueNASConfig(host="truenas.example.com", username="admin", password="secret")
+        )
+        client = TrueNASClient(mock_config)
+        elsewhere = TrueNASClient(TrueNASConfig(host="nas2.example.com", api_key="k"))
+
+        adapter = client.session.get_adapter(client.base_url)
+        assert other.session.get_adapter(other.base_url) is adapter
+        assert elsewhere.session.get_adapter(elsewhere.base_url) is not adapter
+        assert client.session.headers["Authorization"] == "Bearer test-api-key"
+        assert "Authorization" not in other.session.headers
+        assert other.session.auth == ("admin", "secret")
+
+    def test_closing_one_client_keeps_shared_pool_open(self, mock_config):
+        """Closing a session leaves the shared pool working for other clients."""
+        closing = TrueNASClient(mock_config)
+        client = TrueNASClient(mock_config)
+        adapter = client.session.get_adapter(client.base_url)
+        pool = adapter.poolmanager.connection_from_url(client.base_url)
+
+        closing.session.close()
+
+        assert adapter.poolmanager.connection_from_url(client.base_url) is pool
+        assert pool.pool is not None
+        assert _shared_adapter.cache_info().maxsize == 16
+
     def test_authentication_with_api_key(self, mock_client):
         """Test authentication with API key."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"username": "root"}
+        mock_response.content = _json_body({"username": "root"})
         mock_client.session.get.return_value = mock_response
 
         result = mock_client.test_connection()
@@ -125,7 +198,7 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_pools
+        mock_response.content = _json_body(mock_pools)
         mock_client.session.get.return_value = mock_response
 
         pools = mock_client.get_pools()
@@ -135,6 +208,7 @@ class TestTrueNASClient:
         assert pools[0].status == "ONLINE"
         assert pools[0].total_size == 1099511627776
         assert pools[0].used_size == 549755813888
+        assert pools[0].fragmentation == "5%"
 
     def test_get_datasets(self, mock_client):
         """Test getting datasets."""
@@ -154,7 +228,7 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_datasets
+        mock_response.content = _json_body(mock_datasets)
         mock_client.session.get.return_value = mock_response
 
         datasets = mock_client.get_datasets()
@@ -181,7 +255,7 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_extents
+        mock_response.content = _json_body(mock_extents)
         mock_client.session.get.return_value = mock_response
 
         volumes = mock_client.get_volumes()
@@ -207,7 +281,7 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_shares
+        mock_response.content = _json_body(mock_shares)
         mock_client.session.get.return_value = mock_response
 
         shares = mock_client.get_nfs_shares()
@@ -234,7 +308,7 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_snapshots
+        mock_response.content = _json_body(mock_snapshots)
         mock_client.session.get.return_value = mock_response
 
         snapshots = mock_client.get_snapshots()
@@ -244,41 +318,139 @@ class TestTrueNASClient:
         assert snapshots[0].dataset == "tank/k8s/volumes/pvc-abc123"
         assert snapshots[0].used_size == 1073741824
 
-    def test_get_volume_snapshots(self, mock_client):
-        """Test getting snapshots for a specific volume."""
-        volume_name = "pvc-abc123"
-        mock_snapshots = [
-            {
-                "id": f"tank/k8s/volumes/{volume_name}@snapshot-1",
-                "dataset": f"tank/k8s/volumes/{volume_name}",
-                "snapshot_name": "snapshot-1",
-                "properties": {
-                    "used": {"value": "1073741824"},
-                    "creation": {"value": "1704067200"},
-                },
-            }
-        ]
+    def test_get_snapshots_shared_and_missing_properties(self, mock_client):
+        """Snapshots taken together share a timestamp; missing properties default to zero."""
+        created = {"creation": {"value": "1704067200"}}
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = _json_body(
+            [
+                {"id": "tank/a@auto", "properties": created},
+                {"id": "tank/b@auto", "properties": created},
+                {"id": "tank/c@manual", "properties": None},
+            ]
+        )
+        mock_client.session.get.return_value = mock_response
 
-        def get_side_effect(*_args, **_kwargs):
+        first, second, bare = mock_client.get_snapshots()
+
+        assert first.creation_time is second.creation_time
+        assert bare.creation_time == datetime.fromtimestamp(0)
+        assert (bare.used_size, bare.referenced_size) == (0, 0)
+
+    @staticmethod
+    def _route_snapshot_queries(mock_client, datasets, snapshots_by_dataset):
+        """Serve dataset listings and per-dataset snapshot queries from fixtures."""
+
+        def get_side_effect(url, params, **_kwargs):
             response = Mock()
             response.status_code = 200
-            response.json.return_value = mock_snapshots if get_side_effect.calls == 0 else []
-            get_side_effect.calls += 1
+            if url.endswith("/pool/dataset"):
+                response.content = _json_body([{"id": name} for name in datasets])
+            else:
+                prefix = params["dataset__startswith"]
+                response.content = _json_body(
+                    [
+                        snapshot
+                        for dataset, dataset_snapshots in snapshots_by_dataset.items()
+                        if dataset.startswith(prefix)
+                        for snapshot in dataset_snapshots
+                    ]
+                )
             return response
 
-        get_side_effect.calls = 0
         mock_client.session.get.side_effect = get_side_effect
 
+    @staticmethod
+    def _snapshot(dataset, name):
+        return {
+            "id": f"{dataset}@{name}",
+            "dataset": dataset,
+            "snapshot_name": name,
+            "properties": {
+                "used": {"value": "1073741824"},
+                "creation": {"value": "1704067200"},
+            },
+        }
+
+    def test_get_volume_snapshots(self, mock_client):
+        """Volumes outside the default layouts are found via the dataset listing."""
+        volume_name = "pvc-abc123"
+        dataset = f"fast/csi/{volume_name}"
+        self._route_snapshot_queries(
+            mock_client,
+            ["fast/csi", dataset, "fast/csi/pvc-other"],
+            {dataset: [self._snapshot(dataset, "snapshot-1")]},
+        )
+
         snapshots = mock_client.get_volume_snapshots(volume_name)
+        assert mock_client.get_volume_snapshots("pvc-missing") == []
+        mock_client.get_volume_snapshots(volume_name)
 
         assert len(snapshots) == 1
         assert snapshots[0].name == "snapshot-1"
+        urls = [c.args[0] for c in mock_client.session.get.call_args_list]
+        # One dataset listing serves every lookup
+        assert urls.count(f"{mock_client.base_url}/pool/dataset") == 1
         mock_client.session.get.assert_any_call(
             f"{mock_client.base_url}/zfs/snapshot",
-            params={"dataset__startswith": f"tank/k8s/volumes/{volume_name}"},
+            params={"dataset__startswith": dataset},
             timeout=30,
         )
 
+    def test_get_volume_snapshots_default_layout_skips_listing(self, mock_client):
+        """A volume in a default layout is found without listing every dataset."""
+        dataset = "tank/k8s/volumes/pvc-abc123"
+        self._route_snapshot_queries(
+            mock_client, [], {dataset: [self._snapshot(dataset, "snapshot-1")]}
+        )
+
+        snapshots = mock_client.get_volume_snapshots("pvc-abc123")
+
+        assert [snapshot.full_name for snapshot in snapshots] == [f"{dataset}@snapshot-1"]
+        urls = [c.args[0] for c in mock_client.session.get.call_args_list]
+        assert f"{mock_client.base_url}/pool/dataset" not in urls
+
+    def test_get_volume_snapshots_with_stale_dataset_listing(self, mock_client):
+        """A volume created after the listing was cached still reports its snapshots."""
+        other = "fast/csi/pvc-old"
+        fresh = "tank/k8s/nfs/pvc-fresh"
+        snapshots_by_dataset = {other: [self._snapshot(other, "snap")]}
+        self._route_snapshot_queries(mock_client, [other], snapshots_by_dataset)
+        assert len(mock_client.get_volume_snapshots("pvc-old")) == 1
+
+        # The volume appears on the appliance while the cached listing lacks it
+        snapshots_by_dataset[fresh] = [self._snapshot(fresh, "snap")]
+        snapshots = mock_client.get_volume_snapshots("pvc-fresh")
+
+        assert [snapshot.dataset for snapshot in snapshots] == [fresh]
+        urls = [c.args[0] for c in mock_client.session.get.call_args_list]
+        assert urls.count(f"{mock_client.base_url}/pool/dataset") == 1
+
+    def test_get_volume_snapshots_falls_back_to_default_paths(self, mock_client):
+        """Without a dataset listing, the common layouts are probed concurrently."""
+        import requests
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get_side_effect(url, params, **_kwargs):
+            if url.endswith("/pool/dataset"):
+                raise requests.ConnectionError("unreachable")
+            barrier.wait()
+            response = Mock()
+            response.status_code = 200
+            response.content = _json_body([])
+            return response
+
+        mock_client.session.get.side_effect = get_side_effect
+
+        assert mock_client.get_volume_snapshots("pvc-abc123") == []
+        probed = {
+            c.kwargs["params"].get("dataset__startswith")
+            for c in mock_client.session.get.call_args_list
+        }
+        assert "pool0/k8s/nfs/pvc-abc123" in probed
+
     def test_create_snapshot(self, mock_client):
         """Test creating a snapshot."""
         dataset = "tank/k8s/volumes/pvc-abc123"
@@ -286,25 +458,26 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": f"{dataset}@{snapshot_name}",
-            "dataset": dataset,
-            "snapshot_name": snapshot_name,
-        }
+        mock_response.content = _json_body(
+            {
+                "id": f"{dataset}@{snapshot_name}",
+                "dataset": dataset,
+                "snapshot_name": snapshot_name,
+            }
+        )
         mock_client.session.post.return_value = mock_response
 
         result = mock_client.create_snapshot(dataset, snapshot_name)
 
         assert result["id"] == f"{dataset}@{snapshot_name}"
-        mock_client.session.post.assert_called_with(
-            f"{mock_client.base_url}/zfs/snapshot",
-            json={
-                "dataset": dataset,
-                "name": snapshot_name,
-                "recursive": False,
-            },
-            timeout=30,
-        )
+        _, kwargs = mock_client.session.post.call_args
+        assert mock_client.session.post.call_args.args == (f"{mock_client.base_url}/zfs/snapshot",)
+        assert json.loads(kwargs["data"]) == {
+            "dataset": dataset,
+            "name": snapshot_name,
+            "recursive": False,
+        }
+        assert kwargs["timeout"] == 30
 
     def test_delete_snapshot(self, mock_client):
         """Test deleting a snapshot."""
@@ -312,7 +485,7 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = True
+        mock_response.content = _json_body(True)
         mock_client.session.delete.return_value = mock_response
 
         result = mock_client.delete_snapshot(snapshot_id)
@@ -325,6 +498,16 @@ class TestTrueNASClient:
             f"{mock_client.base_url}/zfs/snapshot/id/{encoded_id}", timeout=30
         )
 
+    @pytest.mark.parametrize(
+        "snapshot_id",
+        ["tank/k8s/volumes/pvc-abc123@snapshot-1", "tank/data set@auto:2024+01", "tank/ü@x"],
+    )
+    def test_quote_snapshot_id_matches_quote(self, snapshot_id):
+        """The fast path encodes exactly like urllib.parse.quote."""
+        from urllib.parse import quote
+
+        assert _quote_snapshot_id(snapshot_id) == quote(snapshot_id, safe="")
+
     def test_get_dataset_usage(self, mock_client):
         """Test getting dataset usage statistics."""
         dataset = "tank/k8s"
@@ -346,7 +529,7 @@ class TestTrueNASClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [mock_dataset_info]
+        mock_response.content = _json_body([mock_dataset_info])
         mock_client.session.get.return_value = mock_response
 
         usage = mock_client.get_dataset_usage(dataset)
@@ -371,13 +554,24 @@ class TestTrueNASClient:
 
         mock_response1 = Mock()
         mock_response1.status_code = 200
-        mock_response1.json.return_value = mock_extents
+        mock_response1.content = _json_body(mock_extents)
 
         mock_response2 = Mock()
         mock_response2.status_code = 200
-        mock_response2.json.return_value = mock_shares
+        mock_response2.content = _json_body(mock_shares)
 
-        mock_client.session.get.side_effect = [mock_response1, mock_response2]
+        responses = {
+            f"{mock_client.base_url}/iscsi/extent": mock_response1,
+            f"{mock_client.base_url}/sharing/nfs": mock_response2,
+        }
+        # Both listings must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get(url, **_kwargs):
+            barrier.wait()
+            return responses[url]
+
+        mock_client.session.get.side_effect = get
 
         # K8s volumes to check against
         k8s_volumes = ["pvc-active", "pvc-nfs-active"]
@@ -388,6 +582,20 @@ class TestTrueNASClient:
         assert any(o.name == "pvc-orphaned" for o in orphans)
         assert any(o.name == "pvc-nfs-orphaned" for o in orphans)
 
+    def test_find_orphaned_volumes_with_prefetched_inventory(self, mock_client):
+        """Supplied listings are used as-is instead of being fetched again."""
+        volumes = [
+            VolumeInfo(name="pvc-orphaned", path="/mnt/tank/a", size=1, type="FILE", enabled=True)
+        ]
+        shares = [{"path": "/mnt/tank/k8s/nfs/pvc-active"}]
+
+        orphans = mock_client.find_orphaned_volumes(
+            ["pvc-active"], volumes=volumes, nfs_shares=shares
+        )
+
+        assert [o.name for o in orphans] == ["pvc-orphaned"]
+        mock_client.session.get.assert_not_called()
+
     def test_error_handling(self, mock_client):
         """Test error handling for API failures."""
         mock_response = Mock()
@@ -401,6 +609,16 @@ class TestTrueNASClient:
         with pytest.raises(TrueNASError):
             mock_client.get_pools()
 
+    def test_malformed_response_body(self, mock_client):
+        """A body that is not valid JSON surfaces as a TrueNASError."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>gateway error</html>"
+        mock_client.session.get.return_value = mock_response
+
+        with pytest.raises(TrueNASError, match="Failed to get pools"):
+            mock_client.get_pools()
+
     def test_connection_timeout(self, mock_client):
         """Test handling connection timeouts."""
         import requests
@@ -414,13 +632,64 @@ class TestTrueNASClient:
         """Test handling paginated responses."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {"id": 1, "name": "vol1"},
-            {"id": 2, "name": "vol2"},
-        ]
+        mock_response.content = _json_body(
+            [
+                {"id": 1, "name": "vol1"},
+                {"id": 2, "name": "vol2"},
+            ]
+        )
         mock_response.headers = {"X-Total-Count": "2"}
         mock_client.session.get.return_value = mock_response
 
         result = mock_client._get_all_pages("/some/endpoint")
         assert len(result) == 2
         mock_client.session.get.assert_called_once()
+        _, kwargs = mock_client.session.get.call_args
+        assert kwargs["params"] == {"offset": 0, "limit": 200}
+
+    def test_list_endpoints_walk_pages_without_total(self, mock_client):
+        """List calls page through results and stop at the first short page."""
+        extents = [{"name": f"vol{i}"} for i in range(5)]
+
+        def get(url, params, **_kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.headers = {}
+            offset = params["offset"]
+            response.content = _json_body(extents[offset : offset + params["limit"]])
+            return response
+
+        mock_client.session.get.side_effect = get
+        mock_client.config.page_size = 2
+
+        volumes = mock_client.get_volumes()
+
+        assert [volume.name for volume in volumes] == [f"vol{i}" for i in range(5)]
+        offsets = [c.kwargs["params"]["offset"] for c in mock_client.session.get.call_args_list]
+        assert offsets == [0, 2, 4]
+
+    def test_pagination_fetches_remaining_pages_concurrently(self, mock_client):
+        """With X-Total-Count, later pages are fetched in parallel and kept in order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get(url, params, **_kwargs):
+            offset = params["offset"]
+            if offset:
+                barrier.wait()
+            response = Mock()
+            response.status_code = 200
+            response.headers = {"X-Total-Count": "120"}
+            response.content = _json_body(
+                [{"id": i} for i in range(offset, min(offset + params["limit"], 120))]
+            )
+            return response
+
+        mock_client.session.get.side_effect = get
+        mock_client.config.page_size = 50
+
+        result = mock_client._get_all_pages("/some/endpoint", {"extra": "1"})
+
+        assert [item["id"] for item in result] == list(range(120))
+        assert mock_client.session.get.call_count == 3
+        _, kwargs = mock_client.session.get.call_args
+        assert kwargs["params"]["extra"] == "1"
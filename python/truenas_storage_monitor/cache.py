@@ -0,0 +1,82 @@
+"""In-process TTL cache for inventory list calls."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class InventoryCache:
+    """Thread-safe cache of list results keyed by call.
+
+    Entries are reused for ``ttl_seconds`` after they were loaded. Inside a
+    :meth:`shared` block entries never expire, so a composite operation such as
+    a report sees one consistent inventory and fetches each list at most once,
+    even when the TTL is zero. Concurrent loads of the same key are collapsed
+    into a single call.
+    """
+
+    def __init__(self, ttl_seconds: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a loaded entry stays fresh (0 disables reuse
+                outside of :meth:`shared` blocks)
+            clock: Monotonic time source, overridable for tests
+        """
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._scopes = 0
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the cached value for ``key``, calling ``loader`` on a miss."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            now = self._clock()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and (self._scopes or now - entry[0] < self.ttl_seconds):
+                    return entry[1]
+
+            value = loader()
+
+            with self._lock:
+                if self._scopes or self.ttl_seconds > 0:
+                    self._entries[key] = (now, value)
+            return value
+
+    def invalidate(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    @contextmanager
+    def shared(self) -> Generator[None, None, None]:
+        """Pin entries for the duration of a composite operation.
+
+        Entries that are already past their TTL are dropped on entry, so the
+        block starts from data no older than the TTL.
+        """
+        with self._lock:
+            if not self._scopes:
+                now = self._clock()
+                self._entries = {
+                    key: entry
+                    for key, entry in self._entries.items()
+                    if now - entry[0] < self.ttl_seconds
+                }
+            self._scopes += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._scopes -= 1
+                if not self._scopes and self.ttl_seconds <= 0:
+                    self._entries.clear()
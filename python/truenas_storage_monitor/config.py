@@ -3,6 +3,7 @@
 import os
 import re
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlparse
@@ -13,6 +14,8 @@ from .exceptions import ConfigurationError
 from .k8s_client import K8sConfig
 from .truenas_client import TrueNASConfig
 
+INVENTORY_MODES = ("poll", "watch")
+
 
 class Config:
     """Configuration class for TrueNAS Storage Monitor."""
@@ -116,6 +119,7 @@ class Config:
             use_https=use_https,
             timeout=parse_timeout_seconds(truenas.get("timeout", 30)),
             max_retries=truenas.get("max_retries", 3),
+            page_size=truenas.get("page_size", 200),
         )
 
     @property
@@ -131,14 +135,38 @@ class Config:
         raw = snapshot.get("max_age", "30d")
         return parse_duration(raw)
 
+    @property
+    def inventory_mode(self) -> str:
+        """Kubernetes inventory source from monitoring.inventory.mode (poll or watch)."""
+        inventory = self.monitoring.get("inventory", {})
+        mode = str(inventory.get("mode", "poll")).lower()
+        if mode not in INVENTORY_MODES:
+            raise ConfigurationError(
+                f"Invalid monitoring.inventory.mode {mode!r}; expected one of {INVENTORY_MODES}"
+            )
+        return mode
+
+    @property
+    def inventory_cache_ttl(self) -> timedelta:
+        """Inventory list cache TTL from performance.cache (zero when disabled)."""
+        cache = self.get("performance.cache", {}) or {}
+        if not cache.get("enabled", False):
+            return timedelta(0)
+        return parse_duration(cache.get("ttl", "30s"))
+
     @property
     def metrics_enabled(self) -> bool:
         """Whether Prometheus metrics export is enabled."""
         return bool(self.get("metrics.enabled", False))
 
 
+@lru_cache(maxsize=32)
 def parse_truenas_url(url: str) -> Tuple[str, int, bool]:
-    """Parse a TrueNAS URL into host, port, and TLS scheme flag."""
+    """Parse a TrueNAS URL into host, port, and TLS scheme flag.
+
+    Results are memoized since the same configured URL is parsed each time a
+    client configuration is built.
+    """
     normalized = url if "://" in url else f"https://{url}"
     try:
         parsed = urlparse(normalized)
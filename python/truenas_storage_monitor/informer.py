@@ -0,0 +1,283 @@
+"""Watch-backed Kubernetes inventory cache.
+
+The informer keeps an in-memory copy of the PersistentVolumes,
+PersistentVolumeClaims and VolumeSnapshots the monitor scans. Each kind is
+seeded with a LIST served from the API server watch cache
+(``resourceVersion=0``) and kept fresh with a WATCH that resumes from the last
+seen resource version, so repeated scans read from memory instead of issuing a
+full LIST per call.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from .k8s_client import (
+    SNAPSHOT_GROUP,
+    SNAPSHOT_PLURAL,
+    SNAPSHOT_VERSION,
+    K8sClient,
+    PersistentVolumeClaimInfo,
+    PersistentVolumeInfo,
+    VolumeSnapshotInfo,
+)
+
+logger = logging.getLogger(__name__)
+
+_HTTP_GONE = 410
+_MIN_BACKOFF_SECONDS = 1.0
+_MAX_BACKOFF_SECONDS = 30.0
+
+
+def _object_key(obj: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Return (namespace, name) for a typed model or a custom object dict."""
+    if isinstance(obj, dict):
+        metadata = obj.get("metadata", {})
+        return metadata.get("namespace"), metadata.get("name")
+    return obj.metadata.namespace, obj.metadata.name
+
+
+def _list_items(response: Any) -> Tuple[List[Any], Optional[str]]:
+    """Return the items and list resource version of a LIST response."""
+    if isinstance(response, dict):
+        return response.get("items", []), response.get("metadata", {}).get("resourceVersion")
+    return response.items, response.metadata.resource_version
+
+
+class _Reflector:
+    """Mirrors one resource kind into memory using LIST followed by WATCH."""
+
+    def __init__(
+        self,
+        kind: str,
+        list_func: Callable[..., Any],
+        list_kwargs: Dict[str, Any],
+        convert: Callable[[Any], Optional[Any]],
+        stop_event: threading.Event,
+        watch_timeout_seconds: int,
+        on_change: Callable[[], None],
+    ):
+        self.kind = kind
+        self._list_func = list_func
+        self._list_kwargs = list_kwargs
+        self._convert = convert
+        self._stop = stop_event
+        self._on_change = on_change
+        self._watch_timeout_seconds = watch_timeout_seconds
+        self._items: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.synced = threading.Event()
+
+    def items(self) -> List[Any]:
+        """Return a snapshot of the converted objects."""
+        with self._lock:
+            return list(self._items.values())
+
+    def run(self) -> None:
+        """Relist and watch until stopped, backing off on failures."""
+        backoff = _MIN_BACKOFF_SECONDS
+        while not self._stop.is_set():
+            try:
+                resource_version = self._relist()
+                backoff = _MIN_BACKOFF_SECONDS
+                self._watch(resource_version)
+                continue
+            except ApiException as e:
+                if e.status == _HTTP_GONE:
+                    logger.info("Watch for %s expired; relisting", self.kind)
+                    continue
+                logger.warning("Watch for %s failed: %s", self.kind, e)
+            except Exception as e:
+                logger.warning("Watch for %s failed: %s", self.kind, e)
+
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, _MAX_BACKOFF_SECONDS)
+
+    def _relist(self) -> Optional[str]:
+        response = self._list_func(resource_version="0", **self._list_kwargs)
+        objects, resource_version = _list_items(response)
+
+        items: Dict[Hashable, Any] = {}
+        for obj in objects:
+            info = self._convert(obj)
+            if info is not None:
+                items[_object_key(obj)] = info
+
+        with self._lock:
+            self._items = items
+        self.synced.set()
+        self._on_change()
+        logger.info("Listed %d %s at resourceVersion %s", len(items), self.kind, resource_version)
+        return resource_version
+
+    def _watch(self, resource_version: Optional[str]) -> None:
+        while not self._stop.is_set():
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    self._list_func,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=self._watch_timeout_seconds,
+                    **self._list_kwargs,
+                ):
+                    self._apply(event)
+                    if self._stop.is_set():
+                        break
+            finally:
+                w.stop()
+            resource_version = w.resource_version or resource_version
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        event_type = event["type"]
+        if event_type == "BOOKMARK":
+            return
+
+        obj = event["object"]
+        key = _object_key(obj)
+        info = None if event_type == "DELETED" else self._convert(obj)
+
+        with self._lock:
+            if info is None:
+                self._items.pop(key, None)
+            else:
+                self._items[key] = info
+        self._on_change()
+
+
+class InventoryInformer:
+    """In-memory PV, PVC and VolumeSnapshot inventory kept fresh by watches."""
+
+    def __init__(self, k8s: K8sClient, watch_timeout_seconds: int = 300):
+        """Prepare reflectors for the namespace scope of the Kubernetes client.
+
+        Args:
+            k8s: Kubernetes client whose APIs and filters are mirrored
+            watch_timeout_seconds: Server-side timeout before a watch is resumed
+        """
+        self.namespace = k8s.config.namespace
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._changed = threading.Condition()
+        self._revision = 0
+
+        if self.namespace:
+            pvc_list = k8s.core_v1.list_namespaced_persistent_volume_claim
+            pvc_kwargs: Dict[str, Any] = {"namespace": self.namespace}
+            snapshot_list = k8s.custom_objects.list_namespaced_custom_object
+            snapshot_kwargs: Dict[str, Any] = {"namespace": self.namespace}
+        else:
+            pvc_list = k8s.core_v1.list_persistent_volume_claim_for_all_namespaces
+            pvc_kwargs = {}
+            snapshot_list = k8s.custom_objects.list_cluster_custom_object
+            snapshot_kwargs = {}
+        snapshot_kwargs.update(
+            group=SNAPSHOT_GROUP, version=SNAPSHOT_VERSION, plural=SNAPSHOT_PLURAL
+        )
+
+        self._pvs = _Reflector(
+            "PersistentVolumes",
+            k8s.core_v1.list_persistent_volume,
+            {},
+            k8s.pv_from_object,
+            self._stop,
+            watch_timeout_seconds,
+            self._bump_revision,
+        )
+        self._pvcs = _Reflector(
+            "PersistentVolumeClaims",
+            pvc_list,
+            pvc_kwargs,
+            k8s.pvc_from_object,
+            self._stop,
+            watch_timeout_seconds,
+            self._bump_revision,
+        )
+        self._snapshots = _Reflector(
+            "VolumeSnapshots",
+            snapshot_list,
+            snapshot_kwargs,
+            k8s.snapshot_from_object,
+            self._stop,
+            watch_timeout_seconds,
+            self._bump_revision,
+        )
+        self._reflectors = (self._pvs, self._pvcs, self._snapshots)
+
+    def start(self) -> None:
+        """Start one background reflector thread per resource kind."""
+        if self._threads:
+            return
+        for reflector in self._reflectors:
+            thread = threading.Thread(
+                target=reflector.run,
+                name=f"informer-{reflector.kind}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Signal reflector threads to exit after their current watch."""
+        self._stop.set()
+
+    def _bump_revision(self) -> None:
+        with self._changed:
+            self._revision += 1
+            self._changed.notify_all()
+
+    @property
+    def revision(self) -> int:
+        """Counter that advances whenever any cached inventory changes."""
+        with self._changed:
+            return self._revision
+
+    def wait_for_change(self, revision: int, timeout: Optional[float] = None) -> int:
+        """Block until the inventory moves past ``revision`` or timeout elapses.
+
+        Args:
+            revision: Revision the caller last observed
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The current revision, equal to ``revision`` on timeout
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._revision != revision, timeout)
+            return self._revision
+
+    @property
+    def synced(self) -> bool:
+        """Whether every resource kind has completed its initial LIST."""
+        return all(reflector.synced.is_set() for reflector in self._reflectors)
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until the initial LIST of every kind completes or timeout elapses."""
+        return all(reflector.synced.wait(timeout) for reflector in self._reflectors)
+
+    def covers(self, namespace: Optional[str]) -> bool:
+        """Whether a query for ``namespace`` can be answered from the cache."""
+        return self.namespace is None or namespace in (None, self.namespace)
+
+    def persistent_volumes(self) -> List[PersistentVolumeInfo]:
+        """Return cached PersistentVolumes managed by the CSI driver."""
+        return self._pvs.items()
+
+    def persistent_volume_claims(
+        self, namespace: Optional[str] = None
+    ) -> List[PersistentVolumeClaimInfo]:
+        """Return cached PersistentVolumeClaims, optionally for one namespace."""
+        pvcs = self._pvcs.items()
+        if namespace:
+            return [pvc for pvc in pvcs if pvc.namespace == namespace]
+        return pvcs
+
+    def volume_snapshots(self, namespace: Optional[str] = None) -> List[VolumeSnapshotInfo]:
+        """Return cached VolumeSnapshots, optionally for one namespace."""
+        snapshots = self._snapshots.items()
+        if namespace:
+            return [snapshot for snapshot in snapshots if snapshot.namespace == namespace]
+        return snapshots
@@ -0,0 +1,37 @@
+"""JSON encoding and decoding with an optional fast parser."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised on minimal installs
+    orjson = None
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode a JSON document, using orjson when it is installed.
+
+    Args:
+        data: Raw response body
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as a compact UTF-8 JSON document.
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        Encoded request body
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -1,18 +1,33 @@
 """Kubernetes client wrapper for TrueNAS storage monitoring."""
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Dict, Optional, Any, Generator
+from typing import List, Dict, Optional, Any, Callable, Generator
 
 from kubernetes import client as k8s_client, config, watch
 from kubernetes.client.rest import ApiException
 
-from .time_utils import ensure_utc, utc_now
+from .json_utils import loads as json_loads
+from .time_utils import ensure_utc, parse_rfc3339, utc_now
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_GROUP = "snapshot.storage.k8s.io"
+SNAPSHOT_VERSION = "v1beta1"
+SNAPSHOT_PLURAL = "volumesnapshots"
+
+# Items requested per LIST page so large clusters are fetched in bounded chunks.
+LIST_PAGE_SIZE = 500
+
+# Kubernetes label value syntax: at most 63 alphanumerics, '-', '_' or '.',
+# starting and ending with an alphanumeric.
+_LABEL_VALUE = re.compile(r"[A-Za-z0-9](?:[-A-Za-z0-9_.]{0,61}[A-Za-z0-9])?")
+_DEMOCRATIC_CSI_APP = "democratic-csi"
+
 
 class ResourceType(Enum):
     """Types of Kubernetes resources."""
@@ -37,7 +52,7 @@ class K8sConfig:
     in_cluster: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeInfo:
     """Information about a PersistentVolume."""
 
@@ -54,7 +69,7 @@ class PersistentVolumeInfo:
     annotations: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaimInfo:
     """Information about a PersistentVolumeClaim."""
 
@@ -69,7 +84,7 @@ class PersistentVolumeClaimInfo:
     annotations: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeSnapshotInfo:
     """Information about a VolumeSnapshot."""
 
@@ -83,7 +98,7 @@ class VolumeSnapshotInfo:
     annotations: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrphanedResource:
     """Information about an orphaned resource."""
 
@@ -115,10 +130,12 @@ class K8sClient:
         else:
             config.load_kube_config(config_file=config_obj.kubeconfig)
 
-        # Initialize API clients
-        self.core_v1 = k8s_client.CoreV1Api()
-        self.storage_v1 = k8s_client.StorageV1Api()
-        self.custom_objects = k8s_client.CustomObjectsApi()
+        # Initialize API clients on one ApiClient so they share a single
+        # connection pool instead of each opening their own.
+        self.api_client = k8s_client.ApiClient()
+        self.core_v1 = k8s_client.CoreV1Api(self.api_client)
+        self.storage_v1 = k8s_client.StorageV1Api(self.api_client)
+        self.custom_objects = k8s_client.CustomObjectsApi(self.api_client)
 
     def test_connection(self) -> bool:
         """Verify connectivity to the Kubernetes API server."""
@@ -127,7 +144,7 @@ class K8sClient:
             logger.info("Successfully connected to Kubernetes API")
             return True
         except ApiException as e:
-            logger.error(f"Failed to connect to Kubernetes API: {e}")
+            logger.error("Failed to connect to Kubernetes API: %s", e)
             raise
 
     def list_namespaces(self) -> List[str]:
@@ -135,12 +152,32 @@ class K8sClient:
         try:
             namespaces = self.core_v1.list_namespace()
             names = [item.metadata.name for item in namespaces.items]
-            logger.info(f"Found {len(names)} namespaces")
+            logger.info("Found %d namespaces", len(names))
             return names
         except ApiException as e:
-            logger.error(f"Failed to list namespaces: {e}")
+            logger.error("Failed to list namespaces: %s", e)
             raise
 
+    def _paginate(
+        self, list_func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Generator[Any, None, None]:
+        """Yield the items of a LIST call one page at a time.
+
+        Only one page of API objects is held in memory at once. A
+        ``resource_version`` applies to the first page only; later pages
+        resume from the continue token.
+        """
+        kwargs["limit"] = LIST_PAGE_SIZE
+        while True:
+            page = list_func(*args, **kwargs)
+            yield from page.items
+
+            token = page.metadata._continue
+            if not token:
+                return
+            kwargs.pop("resource_version", None)
+            kwargs["_continue"] = token
+
     def get_persistent_volumes(self) -> List[PersistentVolumeInfo]:
         """Get all PersistentVolumes managed by the CSI driver.
 
@@ -148,41 +185,20 @@ class K8sClient:
             List of PersistentVolumeInfo objects
         """
         try:
-            pvs = self.core_v1.list_persistent_volume()
             result = []
 
-            for pv in pvs.items:
-                # Filter by CSI driver if specified
-                if pv.spec.csi and pv.spec.csi.driver == self.config.csi_driver:
-                    claim_ref = None
-                    if pv.spec.claim_ref:
-                        claim_ref = {
-                            "name": pv.spec.claim_ref.name,
-                            "namespace": pv.spec.claim_ref.namespace,
-                        }
-
-                    pv_info = PersistentVolumeInfo(
-                        name=pv.metadata.name,
-                        volume_handle=pv.spec.csi.volume_handle,
-                        driver=pv.spec.csi.driver,
-                        capacity=pv.spec.capacity.get("storage", ""),
-                        access_modes=pv.spec.access_modes,
-                        phase=pv.status.phase,
-                        storage_class=pv.spec.storage_class_name,
-                        claim_ref=claim_ref,
-                        creation_time=pv.metadata.creation_timestamp,
-                        labels=pv.metadata.labels or {},
-                        annotations=pv.metadata.annotations or {},
-                    )
+            for pv in self._paginate(self.core_v1.list_persistent_volume):
+                pv_info = self.pv_from_object(pv)
+                if pv_info is not None:
                     result.append(pv_info)
 
             logger.info(
-                f"Found {len(result)} PersistentVolumes for driver {self.config.csi_driver}"
+                "Found %d PersistentVolumes for driver %s", len(result), self.config.csi_driver
             )
             return result
 
         except ApiException as e:
-            logger.error(f"Failed to list PersistentVolumes: {e}")
+            logger.error("Failed to list PersistentVolumes: %s", e)
             raise
 
     def get_persistent_volume_claims(
@@ -199,38 +215,32 @@ class K8sClient:
         try:
             namespace = namespace or self.config.namespace
 
+            # resourceVersion "0" lets the API server answer from its watch cache
+            # instead of a quorum read from etcd. PVCs only support metadata field
+            # selectors, so the phase filter has to stay client-side.
             if namespace:
-                pvcs = self.core_v1.list_namespaced_persistent_volume_claim(namespace)
+                pvcs = self._paginate(
+                    self.core_v1.list_namespaced_persistent_volume_claim,
+                    namespace,
+                    resource_version="0",
+                )
             else:
-                pvcs = self.core_v1.list_persistent_volume_claim_for_all_namespaces()
+                pvcs = self._paginate(
+                    self.core_v1.list_persistent_volume_claim_for_all_namespaces,
+                    resource_version="0",
+                )
 
             result = []
-            for pvc in pvcs.items:
-                # Filter by storage class if specified
-                if (
-                    self.config.storage_class
-                    and pvc.spec.storage_class_name != self.config.storage_class
-                ):
-                    continue
+            for pvc in pvcs:
+                pvc_info = self.pvc_from_object(pvc)
+                if pvc_info is not None:
+                    result.append(pvc_info)
 
-                pvc_info = PersistentVolumeClaimInfo(
-                    name=pvc.metadata.name,
-                    namespace=pvc.metadata.namespace,
-                    storage_class=pvc.spec.storage_class_name,
-                    volume_name=pvc.spec.volume_name,
-                    capacity=pvc.spec.resources.requests.get("storage", ""),
-                    phase=pvc.status.phase,
-                    creation_time=pvc.metadata.creation_timestamp,
-                    labels=pvc.metadata.labels or {},
-                    annotations=pvc.metadata.annotations or {},
-                )
-                result.append(pvc_info)
-
-            logger.info(f"Found {len(result)} PersistentVolumeClaims")
+            logger.info("Found %d PersistentVolumeClaims", len(result))
             return result
 
         except ApiException as e:
-            logger.error(f"Failed to list PersistentVolumeClaims: {e}")
+            logger.error("Failed to list PersistentVolumeClaims: %s", e)
             raise
 
     def get_volume_snapshots(self, namespace: Optional[str] = None) -> List[VolumeSnapshotInfo]:
@@ -244,55 +254,138 @@ class K8sClient:
         """
         try:
             namespace = namespace or self.config.namespace
-            group = "snapshot.storage.k8s.io"
-            version = "v1beta1"
-            plural = "volumesnapshots"
 
+            kwargs: Dict[str, Any] = {
+                "group": SNAPSHOT_GROUP,
+                "version": SNAPSHOT_VERSION,
+                "plural": SNAPSHOT_PLURAL,
+                "limit": LIST_PAGE_SIZE,
+            }
             if namespace:
-                snapshots = self.custom_objects.list_namespaced_custom_object(
-                    group=group,
-                    version=version,
-                    namespace=namespace,
-                    plural=plural,
-                )
+                list_func = self.custom_objects.list_namespaced_custom_object
+                kwargs["namespace"] = namespace
             else:
-                snapshots = self.custom_objects.list_cluster_custom_object(
-                    group=group,
-                    version=version,
-                    plural=plural,
-                )
+                list_func = self.custom_objects.list_cluster_custom_object
 
-            result = []
-            for snapshot in snapshots.get("items", []):
-                metadata = snapshot.get("metadata", {})
-                spec = snapshot.get("spec", {})
-                status = snapshot.get("status", {})
-
-                snapshot_info = VolumeSnapshotInfo(
-                    name=metadata.get("name"),
-                    namespace=metadata.get("namespace"),
-                    source_pvc=spec.get("source", {}).get("persistentVolumeClaimName"),
-                    snapshot_class=spec.get("volumeSnapshotClassName"),
-                    ready_to_use=status.get("readyToUse", False),
-                    creation_time=(
-                        datetime.fromisoformat(
-                            metadata.get("creationTimestamp", "").replace("Z", "+00:00")
-                        )
-                        if metadata.get("creationTimestamp")
-                        else None
-                    ),
-                    labels=metadata.get("labels", {}),
-                    annotations=metadata.get("annotations", {}),
+            result: List[VolumeSnapshotInfo] = []
+            while True:
+                # Fetch the raw body and decode it in one pass instead of letting
+                # the generated client deserialize it first.
+                response = list_func(_preload_content=False, **kwargs)
+                try:
+                    page = json_loads(response.data)
+                finally:
+                    response.release_conn()
+
+                result.extend(
+                    self.snapshot_from_object(snapshot) for snapshot in page.get("items", [])
                 )
-                result.append(snapshot_info)
 
-            logger.info(f"Found {len(result)} VolumeSnapshots")
+                token = page.get("metadata", {}).get("continue")
+                if not token:
+                    break
+                kwargs["_continue"] = token
+
+            logger.info("Found %d VolumeSnapshots", len(result))
             return result
 
         except ApiException as e:
-            logger.error(f"Failed to list VolumeSnapshots: {e}")
+            logger.error("Failed to list VolumeSnapshots: %s", e)
             raise
 
+    def pv_from_object(self, pv: Any) -> Optional[PersistentVolumeInfo]:
+        """Convert a V1PersistentVolume, skipping volumes of other CSI drivers.
+
+        Args:
+            pv: PersistentVolume model from a LIST or WATCH response
+
+        Returns:
+            PersistentVolumeInfo, or None if the volume is not managed by the driver
+        """
+        if not (pv.spec.csi and pv.spec.csi.driver == self.config.csi_driver):
+            return None
+
+        claim_ref = None
+        if pv.spec.claim_ref:
+            claim_ref = {
+                "name": pv.spec.claim_ref.name,
+                "namespace": pv.spec.claim_ref.namespace,
+            }
+
+        return PersistentVolumeInfo(
+            name=pv.metadata.name,
+            volume_handle=pv.spec.csi.volume_handle,
+            driver=pv.spec.csi.driver,
+            capacity=pv.spec.capacity.get("storage", ""),
+            access_modes=pv.spec.access_modes,
+            phase=pv.status.phase,
+            storage_class=pv.spec.storage_class_name,
+            claim_ref=claim_ref,
+            creation_time=(
+                ensure_utc(pv.metadata.creation_timestamp)
+                if pv.metadata.creation_timestamp
+                else None
+            ),
+            labels=pv.metadata.labels or {},
+            annotations=pv.metadata.annotations or {},
+        )
+
+    def pvc_from_object(self, pvc: Any) -> Optional[PersistentVolumeClaimInfo]:
+        """Convert a V1PersistentVolumeClaim, applying the storage class filter.
+
+        Args:
+            pvc: PersistentVolumeClaim model from a LIST or WATCH response
+
+        Returns:
+            PersistentVolumeClaimInfo, or None if the claim is filtered out
+        """
+        if self.config.storage_class and pvc.spec.storage_class_name != self.config.storage_class:
+            return None
+
+        return PersistentVolumeClaimInfo(
+            name=pvc.metadata.name,
+            namespace=pvc.metadata.namespace,
+            storage_class=pvc.spec.storage_class_name,
+            volume_name=pvc.spec.volume_name,
+            capacity=pvc.spec.resources.requests.get("storage", ""),
+            phase=pvc.status.phase,
+            creation_time=(
+                ensure_utc(pvc.metadata.creation_timestamp)
+                if pvc.metadata.creation_timestamp
+                else None
+            ),
+            labels=pvc.metadata.labels or {},
+            annotations=pvc.metadata.annotations or {},
+        )
+
+    def snapshot_from_object(self, snapshot: Dict[str, Any]) -> VolumeSnapshotInfo:
+        """Convert a VolumeSnapshot custom object.
+
+        Args:
+            snapshot: VolumeSnapshot as returned by the custom objects API
+
+        Returns:
+            VolumeSnapshotInfo object
+        """
+        metadata = snapshot.get("metadata", {})
+        spec = snapshot.get("spec", {})
+        status = snapshot.get("status", {})
+
+        return VolumeSnapshotInfo(
+            name=metadata.get("name"),
+            namespace=metadata.get("namespace"),
+            source_pvc=spec.get("source", {}).get("persistentVolumeClaimName"),
+            snapshot_class=spec.get("volumeSnapshotClassName"),
+            ready_to_use=status.get("readyToUse", False),
+            creation_time=(
+                parse_rfc3339(metadata["creationTimestamp"])
+                if metadata.get("creationTimestamp")
+                else None
+            ),
+            labels=metadata.get("labels", {}),
+            annotations=metadata.get("annotations", {}),
+        )
+
     def get_storage_classes(self) -> List[Dict[str, Any]]:
         """Get all StorageClasses for the CSI driver.
 
@@ -318,11 +411,11 @@ class K8sClient:
                 }
                 result.append(sc_info)
 
-            logger.info(f"Found {len(result)} StorageClasses")
+            logger.info("Found %d StorageClasses", len(result))
             return result
 
         except ApiException as e:
-            logger.error(f"Failed to list StorageClasses: {e}")
+            logger.error("Failed to list StorageClasses: %s", e)
             raise
 
     def get_csi_nodes(self) -> List[Dict[str, Any]]:
@@ -357,11 +450,11 @@ class K8sClient:
                     }
                     result.append(node_info)
 
-            logger.info(f"Found {len(result)} CSINodes with driver {self.config.csi_driver}")
+            logger.info("Found %d CSINodes with driver %s", len(result), self.config.csi_driver)
             return result
 
         except ApiException as e:
-            logger.error(f"Failed to list CSINodes: {e}")
+            logger.error("Failed to list CSINodes: %s", e)
             raise
 
     def get_csi_driver_pods(self) -> List[Dict[str, Any]]:
@@ -371,27 +464,45 @@ class K8sClient:
             List of pod information
         """
         try:
-            # Common label selectors for CSI drivers
+            # Common label selectors for CSI drivers; set-based selectors match
+            # either name in a single query per label key. A configured name
+            # that is not a valid label value would make the API server reject
+            # the whole selector, so it is left out.
+            driver = self.config.csi_driver
+            names = _DEMOCRATIC_CSI_APP
+            if driver != _DEMOCRATIC_CSI_APP:
+                if driver and _LABEL_VALUE.fullmatch(driver):
+                    names = f"{driver},{_DEMOCRATIC_CSI_APP}"
+                else:
+                    logger.warning(
+                        "CSI driver name %r is not a valid label value; "
+                        "selecting democratic-csi pods only",
+                        driver,
+                    )
             label_selectors = [
-                f"app={self.config.csi_driver}",
-                f"app.kubernetes.io/name={self.config.csi_driver}",
-                "app=democratic-csi",
-                "app.kubernetes.io/name=democratic-csi",
+                f"app in ({names})",
+                f"app.kubernetes.io/name in ({names})",
             ]
 
+            def list_pods(selector: str) -> List[Any]:
+                try:
+                    return self.core_v1.list_pod_for_all_namespaces(label_selector=selector).items
+                except ApiException:
+                    return []
+
+            # The selector queries are independent round trips; issue them together.
+            with ThreadPoolExecutor(max_workers=len(label_selectors)) as pool:
+                pods_by_selector = list(pool.map(list_pods, label_selectors))
+
             all_pods = []
             seen = set()
 
-            for selector in label_selectors:
-                try:
-                    pods = self.core_v1.list_pod_for_all_namespaces(label_selector=selector)
-                    for pod in pods.items:
-                        key = f"{pod.metadata.namespace}/{pod.metadata.name}"
-                        if key not in seen:
-                            seen.add(key)
-                            all_pods.append(pod)
-                except ApiException:
-                    continue
+            for pods in pods_by_selector:
+                for pod in pods:
+                    key = f"{pod.metadata.namespace}/{pod.metadata.name}"
+                    if key not in seen:
+                        seen.add(key)
+                        all_pods.append(pod)
 
             result = []
             for pod in all_pods:
@@ -413,11 +524,11 @@ class K8sClient:
                 }
                 result.append(pod_info)
 
-            logger.info(f"Found {len(result)} CSI driver pods")
+            logger.info("Found %d CSI driver pods", len(result))
             return result
 
         except ApiException as e:
-            logger.error(f"Failed to list CSI driver pods: {e}")
+            logger.error("Failed to list CSI driver pods: %s", e)
             raise
 
     def check_csi_driver_health(self) -> Dict[str, Any]:
@@ -479,7 +590,7 @@ class K8sClient:
                 )
                 orphans.append(orphan)
 
-        logger.info(f"Found {len(orphans)} orphaned PersistentVolumes")
+        logger.info("Found %d orphaned PersistentVolumes", len(orphans))
         return orphans
 
     def find_orphaned_pvcs(self, pending_threshold_minutes: int = 60) -> List[OrphanedResource]:
@@ -516,7 +627,7 @@ class K8sClient:
                 )
                 orphans.append(orphan)
 
-        logger.info(f"Found {len(orphans)} orphaned PersistentVolumeClaims")
+        logger.info("Found %d orphaned PersistentVolumeClaims", len(orphans))
         return orphans
 
     def watch_persistent_volumes(
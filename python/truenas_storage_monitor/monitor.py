@@ -1,8 +1,13 @@
 """Core monitoring functionality."""
 
 import logging
-from datetime import timedelta
-from typing import Dict, List, Optional, Any
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
 
 from .k8s_client import (
     K8sClient,
@@ -13,20 +18,232 @@ from .k8s_client import (
 from .truenas_client import TrueNASClient, VolumeInfo, SnapshotInfo
 from .config import Config
 from .exceptions import TrueNASMonitorError
+from .cache import InventoryCache
+from .informer import InventoryInformer
 from .observability import ScanObservability
 from .time_utils import ensure_utc, resource_age, utc_now
 
 logger = logging.getLogger(__name__)
 
+_BYTES_PER_GIB = 1024**3
+# PVCs requesting more than this are flagged for review.
+_LARGE_PVC_BYTES = 100 * _BYTES_PER_GIB
+
+_SIZE_MULTIPLIERS = {
+    "K": 1024,
+    "KI": 1024,
+    "M": 1024**2,
+    "MI": 1024**2,
+    "G": 1024**3,
+    "GI": 1024**3,
+    "T": 1024**4,
+    "TI": 1024**4,
+    "P": 1024**5,
+    "PI": 1024**5,
+    "E": 1024**6,
+    "EI": 1024**6,
+}
+_SIZE_QUANTITY = re.compile(r"([+]?(?:\d+(?:\.\d*)?|\.\d+))([KMGTPE]I?)?")
+# "democratic-csi" is matched case-sensitively, "truenas" in any case.
+_DEMOCRATIC_CSI_DRIVER = re.compile(r"democratic-csi|(?i:truenas)")
+# Longest a watch feed blocks on the informer before rechecking its stop event.
+_WATCH_POLL_SECONDS = 1.0
+_SCAN_RETRY_MIN_SECONDS = 1.0
+_SCAN_RETRY_MAX_SECONDS = 60.0
+
+
+@lru_cache(maxsize=1024)
+def _storage_size_bytes(size_str: str) -> int:
+    """Convert a Kubernetes quantity such as ``10Gi`` to bytes.
+
+    Clusters reuse a handful of capacity strings, so results are memoized.
+    """
+    match = _SIZE_QUANTITY.fullmatch(size_str.upper())
+    if match is None:
+        return 0
+    number, suffix = match.groups()
+    if suffix is None:
+        return int(float(number))
+    return int(float(number) * _SIZE_MULTIPLIERS[suffix])
+
+
+def _run_concurrently(
+    tasks: Dict[str, Callable[[], Any]], obs: Optional[ScanObservability] = None
+) -> Dict[str, Any]:
+    """Run independent blocking calls on worker threads and return results by name.
+
+    Each task is timed as its own phase when ``obs`` is given. All tasks are
+    allowed to finish; the first failure (in task order) is then re-raised.
+    """
+
+    def run(name: str, task: Callable[[], Any]) -> Any:
+        if obs is None:
+            return task()
+        with obs.phase(name):
+            return task()
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {name: pool.submit(run, name, task) for name, task in tasks.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+_ORPHAN_CATEGORIES = ("orphaned_pvs", "orphaned_pvcs", "orphaned_snapshots")
+
+
+def _index_orphans(result: Dict[str, Any]) -> Dict[str, Dict[Tuple[Any, Any], Dict]]:
+    """Key each orphan category of a scan result by (namespace, name).
+
+    TrueNAS snapshots have no namespace and periodic tasks reuse short names
+    across datasets, so they are keyed by their unique ``dataset@name``.
+    """
+    return {
+        category: {
+            (orphan.get("namespace"), orphan.get("full_name") or orphan["name"]): orphan
+            for orphan in result[category]
+        }
+        for category in _ORPHAN_CATEGORIES
+    }
+
+
+class _SubstringIndex:
+    """Set of names answering "is any name inside, or containing, this string?".
+
+    Equivalent to ``any(name in query or query in name for name in names)``
+    but built once per scan: names inside the query are found by probing the
+    query's substrings of each distinct name length against a set, and the
+    query inside a name by one search over the NUL-joined names (NUL never
+    appears in Kubernetes or ZFS names, so a hit cannot straddle two names).
+    """
+
+    __slots__ = ("_names", "_lengths", "_joined")
+
+    def __init__(self, names: Iterable[str]):
+        self._names = set(names)
+        self._lengths = sorted({len(name) for name in self._names})
+        self._joined = "\0".join(self._names)
+
+    def matches(self, query: str) -> bool:
+        names = self._names
+        if not names:
+            return False
+        if query in names or query in self._joined:
+            return True
+
+        size = len(query)
+        for length in self._lengths:
+            if length > size:
+                break
+            for start in range(size - length + 1):
+                if query[start : start + length] in names:
+                    return True
+        return False
+
 
 class Monitor:
     """Main monitoring class that orchestrates storage monitoring."""
 
+    __slots__ = (
+        "config",
+        "_k8s_client",
+        "_truenas_client",
+        "_client_lock",
+        "_inventory_cache",
+        "_informer",
+    )
+
     def __init__(self, config: Config):
-        """Initialize the monitor with configuration."""
+        """Initialize the monitor with configuration.
+
+        The Kubernetes and TrueNAS clients are built on first use, so a
+        Kubernetes-only operation works even when TrueNAS settings are missing
+        or the array is unreachable at startup.
+        """
         self.config = config
-        self.k8s_client = K8sClient(config.k8s_config())
-        self.truenas_client = TrueNASClient(config.truenas_config())
+        self._k8s_client: Optional[K8sClient] = None
+        self._truenas_client: Optional[TrueNASClient] = None
+        self._client_lock = threading.Lock()
+        self._inventory_cache = InventoryCache(config.inventory_cache_ttl.total_seconds())
+        self._informer: Optional[InventoryInformer] = None
+        if config.inventory_mode == "watch":
+            self._informer = InventoryInformer(self.k8s_client)
+            self._informer.start()
+
+    @property
+    def k8s_client(self) -> K8sClient:
+        """Kubernetes client, created on first access."""
+        client = self._k8s_client
+        if client is None:
+            with self._client_lock:
+                if self._k8s_client is None:
+                    self._k8s_client = K8sClient(self.config.k8s_config())
+                client = self._k8s_client
+        return client
+
+    @property
+    def truenas_client(self) -> TrueNASClient:
+        """TrueNAS client, created on first access."""
+        client = self._truenas_client
+        if client is None:
+            with self._client_lock:
+                if self._truenas_client is None:
+                    self._truenas_client = TrueNASClient(self.config.truenas_config())
+                client = self._truenas_client
+        return client
+
+    def close(self) -> None:
+        """Stop background watches started for watch-mode inventory."""
+        if self._informer is not None:
+            self._informer.stop()
+
+    def invalidate_inventory(self) -> None:
+        """Drop cached inventory lists so the next scan fetches fresh data."""
+        self._inventory_cache.invalidate()
+        if self._truenas_client is not None:
+            self._truenas_client.invalidate_cache()
+
+    def _use_informer(self, namespace: Optional[str] = None) -> bool:
+        """Whether Kubernetes inventory can be served from the watch cache.
+
+        Until the informer finishes its initial LIST (or when the query falls
+        outside its namespace scope) scans fall back to direct LIST calls.
+        """
+        informer = self._informer
+        return informer is not None and informer.synced and informer.covers(namespace)
+
+    def _list_pvs(self) -> List[PersistentVolumeInfo]:
+        if self._use_informer():
+            return self._informer.persistent_volumes()
+        return self._inventory_cache.get("k8s_pvs", self.k8s_client.get_persistent_volumes)
+
+    def _list_pvcs(self, namespace: Optional[str] = None) -> List[PersistentVolumeClaimInfo]:
+        if self._use_informer(namespace):
+            return self._informer.persistent_volume_claims(namespace)
+        return self._inventory_cache.get(
+            ("k8s_pvcs", namespace),
+            lambda: self.k8s_client.get_persistent_volume_claims(namespace),
+        )
+
+    def _list_k8s_snapshots(self, namespace: Optional[str] = None) -> List[VolumeSnapshotInfo]:
+        if self._use_informer(namespace):
+            return self._informer.volume_snapshots(namespace)
+        return self._inventory_cache.get(
+            ("k8s_snapshots", namespace),
+            lambda: self.k8s_client.get_volume_snapshots(namespace),
+        )
+
+    def _list_truenas_volumes(self) -> List[VolumeInfo]:
+        return self._inventory_cache.get("truenas_volumes", self.truenas_client.get_volumes)
+
+    def _list_truenas_snapshots(self) -> List[SnapshotInfo]:
+        return self._inventory_cache.get("truenas_snapshots", self.truenas_client.get_snapshots)
+
+    # Successful connectivity probes share the inventory TTL; failures raise and
+    # are never cached, so an outage is re-probed on the next call.
+    def _test_k8s_connection(self) -> bool:
+        return self._inventory_cache.get("k8s_connection", self.k8s_client.test_connection)
+
+    def _test_truenas_connection(self) -> bool:
+        return self._inventory_cache.get("truenas_connection", self.truenas_client.test_connection)
 
     def find_orphaned_resources(
         self,
@@ -52,21 +269,27 @@ class Monitor:
         obs.begin_scan()
 
         try:
-            with obs.phase("k8s_pvs"):
-                k8s_pvs = self.k8s_client.get_persistent_volumes()
-            with obs.phase("k8s_pvcs"):
-                k8s_pvcs = self.k8s_client.get_persistent_volume_claims(namespace)
-            with obs.phase("k8s_snapshots"):
-                k8s_snapshots = self.k8s_client.get_volume_snapshots(namespace)
-            with obs.phase("truenas_datasets"):
-                truenas_volumes = self.truenas_client.get_volumes()
-            with obs.phase("truenas_snapshots"):
-                truenas_snapshots = self.truenas_client.get_snapshots()
-
-            orphaned_pvs = self._find_orphaned_pvs(k8s_pvs, truenas_volumes, age_threshold)
-            orphaned_pvcs = self._find_orphaned_pvcs(k8s_pvcs, age_threshold)
+            inventory = _run_concurrently(
+                {
+                    "k8s_pvs": self._list_pvs,
+                    "k8s_pvcs": lambda: self._list_pvcs(namespace),
+                    "k8s_snapshots": lambda: self._list_k8s_snapshots(namespace),
+                    "truenas_datasets": self._list_truenas_volumes,
+                    "truenas_snapshots": self._list_truenas_snapshots,
+                },
+                obs,
+            )
+            k8s_pvs = inventory["k8s_pvs"]
+            k8s_pvcs = inventory["k8s_pvcs"]
+            k8s_snapshots = inventory["k8s_snapshots"]
+            truenas_volumes = inventory["truenas_datasets"]
+            truenas_snapshots = inventory["truenas_snapshots"]
+
+            now = utc_now()
+            orphaned_pvs = self._find_orphaned_pvs(k8s_pvs, truenas_volumes, age_threshold, now)
+            orphaned_pvcs = self._find_orphaned_pvcs(k8s_pvcs, age_threshold, now)
             orphaned_snapshots = self._find_orphaned_snapshots(
-                k8s_snapshots, truenas_snapshots, age_threshold, snapshot_retention
+                k8s_snapshots, truenas_snapshots, age_threshold, snapshot_retention, now
             )
 
             scan_duration = obs.finish_scan()
@@ -86,21 +309,132 @@ class Monitor:
             }
 
         except Exception as e:
-            logger.error(f"Error finding orphaned resources: {e}")
+            logger.error("Error finding orphaned resources: %s", e)
             raise TrueNASMonitorError(f"Failed to scan for orphaned resources: {e}")
 
+    def watch_orphaned_resources(
+        self,
+        namespace: Optional[str] = None,
+        resync_seconds: float = 60.0,
+        settle_seconds: float = 1.0,
+        min_rescan_seconds: float = 15.0,
+        stop_event: Optional[threading.Event] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Yield changes to the set of orphaned resources.
+
+        The first item reports every current orphan as added; later items only
+        carry orphans that appeared or were resolved since the previous one.
+        In watch inventory mode informer events trigger a rescan, but never
+        sooner than ``min_rescan_seconds`` after the previous one, since each
+        scan also lists TrueNAS. TrueNAS has no watch and resources age past
+        the threshold, so a scan also runs at least every ``resync_seconds``.
+        A failed scan is logged and retried with exponential backoff.
+
+        Args:
+            namespace: Namespace to scan (None for the configured scope)
+            resync_seconds: Longest time between scans
+            settle_seconds: Delay after an informer event before rescanning
+            min_rescan_seconds: Shortest time between event-triggered scans
+            stop_event: Event that ends the feed once set
+
+        Yields:
+            Dictionaries with ``timestamp``, ``added`` and ``resolved`` keys;
+            the latter two map each orphan category to a list of orphans
+        """
+        stop_event = stop_event or threading.Event()
+        known: Dict[str, Dict[Tuple[Any, Any], Dict]] = {
+            category: {} for category in _ORPHAN_CATEGORIES
+        }
+        backoff = _SCAN_RETRY_MIN_SECONDS
+
+        while not stop_event.is_set():
+            revision = self._informer.revision if self._informer is not None else None
+            try:
+                result = self.find_orphaned_resources(namespace)
+            except TrueNASMonitorError as e:
+                logger.warning("Orphan scan failed; retrying in %.0fs: %s", backoff, e)
+                stop_event.wait(backoff)
+                backoff = min(backoff * 2, _SCAN_RETRY_MAX_SECONDS)
+                continue
+            backoff = _SCAN_RETRY_MIN_SECONDS
+            current = _index_orphans(result)
+
+            added = {
+                category: [
+                    orphan
+                    for key, orphan in current[category].items()
+                    if key not in known[category]
+                ]
+                for category in _ORPHAN_CATEGORIES
+            }
+            resolved = {
+                category: [
+                    orphan
+                    for key, orphan in known[category].items()
+                    if key not in current[category]
+                ]
+                for category in _ORPHAN_CATEGORIES
+            }
+            known = current
+
+            if any(added.values()) or any(resolved.values()):
+                yield {"timestamp": result["timestamp"], "added": added, "resolved": resolved}
+
+            self._wait_for_rescan(
+                revision, resync_seconds, settle_seconds, min_rescan_seconds, stop_event
+            )
+
+    def _wait_for_rescan(
+        self,
+        revision: Optional[int],
+        resync_seconds: float,
+        settle_seconds: float,
+        min_rescan_seconds: float,
+        stop_event: threading.Event,
+    ) -> None:
+        """Block until the next orphan scan is due or ``stop_event`` is set.
+
+        Informer waits are sliced so that setting ``stop_event`` ends the wait
+        within ``_WATCH_POLL_SECONDS``.
+        """
+        scanned = time.monotonic()
+        deadline = scanned + resync_seconds
+        changed = revision is None
+        while not stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if changed:
+                stop_event.wait(remaining)
+            elif (
+                self._informer.wait_for_change(revision, min(remaining, _WATCH_POLL_SECONDS))
+                != revision
+            ):
+                changed = True
+                deadline = min(
+                    deadline,
+                    max(time.monotonic() + settle_seconds, scanned + min_rescan_seconds),
+                )
+
     def _find_orphaned_pvs(
         self,
         k8s_pvs: List[PersistentVolumeInfo],
         truenas_volumes: List[VolumeInfo],
         age_threshold: timedelta,
+        now: Optional[datetime] = None,
     ) -> List[Dict]:
         """Find PVs without corresponding TrueNAS volumes."""
         orphaned = []
-        threshold = utc_now() - age_threshold
+        now = now or utc_now()
+        threshold = now - age_threshold
+        volume_names = _SubstringIndex(volume.name for volume in truenas_volumes)
+        # Bound once outside the loop; these run for every PV in the cluster.
+        append = orphaned.append
+        is_democratic_csi_pv = self._is_democratic_csi_pv
+        has_truenas_volume = self._has_corresponding_truenas_volume
 
         for pv in k8s_pvs:
-            if not self._is_democratic_csi_pv(pv):
+            if not is_democratic_csi_pv(pv):
                 continue
 
             if pv.creation_time is None:
@@ -110,9 +444,9 @@ class Monitor:
             if created > threshold:
                 continue
 
-            if not self._has_corresponding_truenas_volume(pv, truenas_volumes):
-                age = resource_age(created)
-                orphaned.append(
+            if not has_truenas_volume(pv, volume_names):
+                age = resource_age(created, now)
+                append(
                     {
                         "name": pv.name,
                         "age": age,
@@ -125,11 +459,16 @@ class Monitor:
         return orphaned
 
     def _find_orphaned_pvcs(
-        self, k8s_pvcs: List[PersistentVolumeClaimInfo], age_threshold: timedelta
+        self,
+        k8s_pvcs: List[PersistentVolumeClaimInfo],
+        age_threshold: timedelta,
+        now: Optional[datetime] = None,
     ) -> List[Dict]:
         """Find unbound PVCs older than threshold."""
         orphaned = []
-        threshold = utc_now() - age_threshold
+        now = now or utc_now()
+        threshold = now - age_threshold
+        append = orphaned.append
 
         for pvc in k8s_pvcs:
             if pvc.phase != "Pending" or pvc.creation_time is None:
@@ -137,8 +476,8 @@ class Monitor:
 
             created = ensure_utc(pvc.creation_time)
             if created <= threshold:
-                age = resource_age(created)
-                orphaned.append(
+                age = resource_age(created, now)
+                append(
                     {
                         "name": pvc.name,
                         "namespace": pvc.namespace,
@@ -157,11 +496,25 @@ class Monitor:
         truenas_snapshots: List[SnapshotInfo],
         age_threshold: timedelta,
         snapshot_retention: timedelta,
+        now: Optional[datetime] = None,
     ) -> List[Dict]:
         """Find snapshots without corresponding resources."""
         orphaned = []
-        threshold = utc_now() - age_threshold
-        retention_threshold = utc_now() - snapshot_retention
+        now = now or utc_now()
+        threshold = now - age_threshold
+        retention_threshold = now - snapshot_retention
+        truenas_names = _SubstringIndex(
+            name
+            for truenas_snapshot in truenas_snapshots
+            for name in (truenas_snapshot.name, truenas_snapshot.full_name)
+            if name
+        )
+        k8s_names = _SubstringIndex(
+            snapshot.name for snapshot in k8s_snapshots if snapshot.name is not None
+        )
+        append = orphaned.append
+        has_truenas_snapshot = self._has_corresponding_truenas_snapshot
+        has_k8s_snapshot = self._has_corresponding_k8s_snapshot
 
         for snapshot in k8s_snapshots:
             if snapshot.creation_time is None:
@@ -171,12 +524,12 @@ class Monitor:
             if created > threshold:
                 continue
 
-            if not self._has_corresponding_truenas_snapshot(snapshot, truenas_snapshots):
-                orphaned.append(
+            if not has_truenas_snapshot(snapshot, truenas_names):
+                append(
                     {
                         "name": snapshot.name,
                         "namespace": snapshot.namespace,
-                        "age": resource_age(created),
+                        "age": resource_age(created, now),
                         "reason": "No corresponding TrueNAS snapshot found",
                         "source_pvc": snapshot.source_pvc or "Unknown",
                     }
@@ -190,11 +543,12 @@ class Monitor:
             )
             if created is None or created > retention_threshold:
                 continue
-            if not self._has_corresponding_k8s_snapshot(truenas_snapshot, k8s_snapshots):
-                orphaned.append(
+            if not has_k8s_snapshot(truenas_snapshot, k8s_names):
+                append(
                     {
                         "name": truenas_snapshot.name,
-                        "age": resource_age(created),
+                        "full_name": truenas_snapshot.full_name,
+                        "age": resource_age(created, now),
                         "reason": "Old TrueNAS snapshot without corresponding VolumeSnapshot",
                     }
                 )
@@ -202,61 +556,47 @@ class Monitor:
         return orphaned
 
     def _has_corresponding_k8s_snapshot(
-        self, truenas_snapshot: SnapshotInfo, k8s_snapshots: List[VolumeSnapshotInfo]
+        self, truenas_snapshot: SnapshotInfo, k8s_names: _SubstringIndex
     ) -> bool:
         """Check if TrueNAS snapshot correlates with a K8s VolumeSnapshot."""
-        names = {truenas_snapshot.name, truenas_snapshot.full_name}
-        for snapshot in k8s_snapshots:
-            if any(
-                name and (snapshot.name in name or name in snapshot.name) for name in names if name
-            ):
-                return True
-        return False
+        return any(
+            k8s_names.matches(name)
+            for name in (truenas_snapshot.name, truenas_snapshot.full_name)
+            if name
+        )
 
     def _is_democratic_csi_pv(self, pv: PersistentVolumeInfo) -> bool:
         """Check if PV is managed by democratic-csi."""
-        driver = pv.driver or ""
-        return "democratic-csi" in driver or "truenas" in driver.lower()
+        return _DEMOCRATIC_CSI_DRIVER.search(pv.driver or "") is not None
 
     def _has_corresponding_truenas_volume(
-        self, pv: PersistentVolumeInfo, truenas_volumes: List[VolumeInfo]
+        self, pv: PersistentVolumeInfo, volume_names: _SubstringIndex
     ) -> bool:
         """Check if PV has corresponding TrueNAS volume."""
         volume_handle = pv.volume_handle
         if not volume_handle:
             return False
-
-        for volume in truenas_volumes:
-            if volume.name in volume_handle or volume_handle in volume.name:
-                return True
-
-        return False
+        return volume_names.matches(volume_handle)
 
     def _has_corresponding_truenas_snapshot(
-        self, snapshot: VolumeSnapshotInfo, truenas_snapshots: List[SnapshotInfo]
+        self, snapshot: VolumeSnapshotInfo, truenas_names: _SubstringIndex
     ) -> bool:
         """Check if K8s snapshot has corresponding TrueNAS snapshot."""
-        snapshot_name = snapshot.name
-
-        for truenas_snapshot in truenas_snapshots:
-            names = {truenas_snapshot.name, truenas_snapshot.full_name}
-            if any(name and (snapshot_name in name or name in snapshot_name) for name in names):
-                return True
-
-        return False
+        return truenas_names.matches(snapshot.name)
 
     def analyze_storage_usage(
         self, days: int = 7, namespace: Optional[str] = None
     ) -> Dict[str, Any]:
         """Analyze storage usage and trends."""
-        logger.info(f"Analyzing storage usage for {days} days")
+        logger.info("Analyzing storage usage for %d days", days)
 
         try:
-            pvcs = self.k8s_client.get_persistent_volume_claims(namespace)
-            pvs = self.k8s_client.get_persistent_volumes()
-            truenas_volumes = self.truenas_client.get_volumes()
+            pvcs = self._list_pvcs(namespace)
+            pvs = self._list_pvs()
+            truenas_volumes = self._list_truenas_volumes()
 
-            total_allocated = sum(self._parse_storage_size(pvc.capacity or "0") for pvc in pvcs)
+            pvc_sizes = [self._parse_storage_size(pvc.capacity or "0") for pvc in pvcs]
+            total_allocated = sum(pvc_sizes)
             total_used = sum(self._get_volume_used_space(vol) for vol in truenas_volumes)
 
             efficiency = (
@@ -264,56 +604,47 @@ class Monitor:
             )
 
             return {
-                "total_allocated_gb": total_allocated / (1024**3),
-                "total_used_gb": total_used / (1024**3),
+                "total_allocated_gb": total_allocated / _BYTES_PER_GIB,
+                "total_used_gb": total_used / _BYTES_PER_GIB,
                 "thin_provisioning_efficiency": f"{efficiency:.1f}%",
                 "total_pvcs": len(pvcs),
                 "total_pvs": len(pvs),
                 "growth_trend": "Stable",  # TODO: Implement trend analysis
-                "recommendations": self._generate_recommendations(pvcs, truenas_volumes),
+                "recommendations": self._generate_recommendations(pvcs, truenas_volumes, pvc_sizes),
             }
 
         except Exception as e:
-            logger.error(f"Error analyzing storage usage: {e}")
+            logger.error("Error analyzing storage usage: %s", e)
             raise TrueNASMonitorError(f"Failed to analyze storage usage: {e}")
 
     def _parse_storage_size(self, size_str: str) -> int:
         """Parse Kubernetes storage size string to bytes."""
         if not size_str:
             return 0
-
-        size_str = size_str.upper()
-        multipliers = {
-            "K": 1024,
-            "KI": 1024,
-            "M": 1024**2,
-            "MI": 1024**2,
-            "G": 1024**3,
-            "GI": 1024**3,
-            "T": 1024**4,
-            "TI": 1024**4,
-        }
-
-        for suffix, multiplier in multipliers.items():
-            if size_str.endswith(suffix):
-                return int(float(size_str[: -len(suffix)]) * multiplier)
-
-        return int(size_str) if size_str.isdigit() else 0
+        return _storage_size_bytes(size_str)
 
     def _get_volume_used_space(self, volume: VolumeInfo) -> int:
         """Get used space for a TrueNAS volume."""
         return volume.size
 
     def _generate_recommendations(
-        self, pvcs: List[PersistentVolumeClaimInfo], truenas_volumes: List[VolumeInfo]
+        self,
+        pvcs: List[PersistentVolumeClaimInfo],
+        truenas_volumes: List[VolumeInfo],
+        pvc_sizes: Optional[List[int]] = None,
     ) -> List[str]:
-        """Generate storage optimization recommendations."""
+        """Generate storage optimization recommendations.
+
+        ``pvc_sizes`` holds the already parsed capacity of each PVC, in order,
+        so callers that summed them do not parse every quantity twice.
+        """
         recommendations = []
+        if pvc_sizes is None:
+            pvc_sizes = [self._parse_storage_size(pvc.capacity or "0") for pvc in pvcs]
 
-        for pvc in pvcs:
-            requested = self._parse_storage_size(pvc.capacity or "0")
-            if requested > 100 * 1024**3:
-                size_gb = requested / 1024**3
+        for pvc, requested in zip(pvcs, pvc_sizes):
+            if requested > _LARGE_PVC_BYTES:
+                size_gb = requested / _BYTES_PER_GIB
                 recommendations.append(
                     f"Consider reviewing large PVC: {pvc.name} ({size_gb:.1f}GB)"
                 )
@@ -330,9 +661,19 @@ class Monitor:
         logger.info("Generating comprehensive storage report")
 
         try:
-            orphans = self.find_orphaned_resources()
-            analysis = self.analyze_storage_usage()
-            health = self.check_health()
+            # The scans are independent; inside the shared block concurrent
+            # requests for the same inventory list still collapse into one fetch.
+            with self._inventory_cache.shared():
+                results = _run_concurrently(
+                    {
+                        "orphans": self.find_orphaned_resources,
+                        "analysis": self.analyze_storage_usage,
+                        "health": self.check_health,
+                    }
+                )
+            orphans = results["orphans"]
+            analysis = results["analysis"]
+            health = results["health"]
 
             return {
                 "timestamp": utc_now().isoformat(),
@@ -350,71 +691,73 @@ class Monitor:
             }
 
         except Exception as e:
-            logger.error(f"Error generating report: {e}")
+            logger.error("Error generating report: %s", e)
             raise TrueNASMonitorError(f"Failed to generate report: {e}")
 
     def validate_configuration(self) -> Dict[str, Dict[str, Any]]:
         """Validate system configuration."""
         logger.info("Validating configuration")
 
-        results = {}
-
-        try:
-            self.k8s_client.test_connection()
-            results["kubernetes"] = {"valid": True, "message": "Connection successful"}
-        except Exception as e:
-            results["kubernetes"] = {"valid": False, "message": str(e)}
-
-        try:
-            self.truenas_client.test_connection()
-            results["truenas"] = {"valid": True, "message": "Connection successful"}
-        except Exception as e:
-            results["truenas"] = {"valid": False, "message": str(e)}
-
-        try:
-            namespaces = self.k8s_client.list_namespaces()
-            csi_namespace = self.config.openshift.get("namespace", "democratic-csi")
-            if csi_namespace in namespaces:
-                results["democratic_csi"] = {
-                    "valid": True,
-                    "message": f"Namespace {csi_namespace} found",
-                }
-            else:
-                results["democratic_csi"] = {
-                    "valid": False,
-                    "message": f"Namespace {csi_namespace} not found",
-                }
-        except Exception as e:
-            results["democratic_csi"] = {"valid": False, "message": str(e)}
-
-        return results
+        def kubernetes() -> Dict[str, Any]:
+            try:
+                self._test_k8s_connection()
+                return {"valid": True, "message": "Connection successful"}
+            except Exception as e:
+                return {"valid": False, "message": str(e)}
+
+        def truenas() -> Dict[str, Any]:
+            try:
+                self._test_truenas_connection()
+                return {"valid": True, "message": "Connection successful"}
+            except Exception as e:
+                return {"valid": False, "message": str(e)}
+
+        def democratic_csi() -> Dict[str, Any]:
+            try:
+                namespaces = self.k8s_client.list_namespaces()
+                csi_namespace = self.config.openshift.get("namespace", "democratic-csi")
+                if csi_namespace in namespaces:
+                    return {"valid": True, "message": f"Namespace {csi_namespace} found"}
+                return {"valid": False, "message": f"Namespace {csi_namespace} not found"}
+            except Exception as e:
+                return {"valid": False, "message": str(e)}
+
+        # The probes are independent round trips, so run them side by side.
+        return _run_concurrently(
+            {"kubernetes": kubernetes, "truenas": truenas, "democratic_csi": democratic_csi}
+        )
 
     def check_health(self) -> Dict[str, Any]:
         """Check overall system health."""
         logger.info("Checking system health")
 
-        components = {}
-
-        try:
-            self.k8s_client.test_connection()
-            components["kubernetes"] = {"healthy": True, "message": "API server accessible"}
-        except Exception as e:
-            components["kubernetes"] = {"healthy": False, "message": str(e)}
-
-        try:
-            self.truenas_client.test_connection()
-            components["truenas"] = {"healthy": True, "message": "API accessible"}
-        except Exception as e:
-            components["truenas"] = {"healthy": False, "message": str(e)}
+        def kubernetes() -> Dict[str, Any]:
+            try:
+                self._test_k8s_connection()
+                return {"healthy": True, "message": "API server accessible"}
+            except Exception as e:
+                return {"healthy": False, "message": str(e)}
+
+        def truenas() -> Dict[str, Any]:
+            try:
+                self._test_truenas_connection()
+                return {"healthy": True, "message": "API accessible"}
+            except Exception as e:
+                return {"healthy": False, "message": str(e)}
+
+        def csi_driver() -> Dict[str, Any]:
+            try:
+                csi_health = self.k8s_client.check_csi_driver_health()
+                return {
+                    "healthy": csi_health["healthy"],
+                    "message": csi_health.get("reason", "CSI driver health unknown"),
+                }
+            except Exception as e:
+                return {"healthy": False, "message": str(e)}
 
-        try:
-            csi_health = self.k8s_client.check_csi_driver_health()
-            components["csi_driver"] = {
-                "healthy": csi_health["healthy"],
-                "message": csi_health.get("reason", "CSI driver health unknown"),
-            }
-        except Exception as e:
-            components["csi_driver"] = {"healthy": False, "message": str(e)}
+        components = _run_concurrently(
+            {"kubernetes": kubernetes, "truenas": truenas, "csi_driver": csi_driver}
+        )
 
         overall_healthy = all(comp["healthy"] for comp in components.values())
 
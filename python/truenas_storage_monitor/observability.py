@@ -6,7 +6,7 @@ import logging
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, Generator, Optional, Protocol
+from typing import Dict, Generator, Mapping, Optional, Protocol
 
 
 class ScanMetricsProtocol(Protocol):
@@ -18,6 +18,9 @@ class ScanMetricsProtocol(Protocol):
     def observe_list_phase(self, phase: str, duration: float) -> None:
         """Record list phase duration in seconds."""
 
+    def observe_scan_phases(self, duration: float, phase_timings: Mapping[str, float]) -> None:
+        """Record total scan duration and every list phase duration."""
+
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +54,7 @@ class ScanObservability:
             return 0.0
         duration = time.perf_counter() - self._scan_start
         if self._metrics is not None:
-            self._metrics.observe_scan(duration)
-            for phase, phase_duration in self.phase_timings.items():
-                self._metrics.observe_list_phase(phase, phase_duration)
+            self._metrics.observe_scan_phases(duration, self.phase_timings)
         return duration
 
     @contextmanager
@@ -65,7 +66,10 @@ class ScanObservability:
         finally:
             elapsed = time.perf_counter() - start
             self.phase_timings[name] = elapsed
-            logger.info("Scan phase completed", extra={"phase": name, "duration_seconds": elapsed})
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Scan phase completed", extra={"phase": name, "duration_seconds": elapsed}
+                )
 
 
 def _get_metrics_registry() -> ScanMetricsProtocol:
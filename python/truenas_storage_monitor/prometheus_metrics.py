@@ -1,6 +1,12 @@
 """Optional Prometheus metrics for Python monitor scans."""
 
-from typing import Any, Tuple
+from typing import Any, Mapping, Tuple
+
+# List phases emitted by Monitor.find_orphaned_resources; anything else is
+# recorded as "other" so the phase label stays bounded.
+_KNOWN_PHASES = frozenset(
+    {"k8s_pvs", "k8s_pvcs", "k8s_snapshots", "truenas_datasets", "truenas_snapshots"}
+)
 
 _scan_duration: Any = None
 _list_duration: Any = None
@@ -25,13 +31,26 @@ def _histograms() -> Tuple[Any, Any]:
     return _scan_duration, _list_duration
 
 
+def _phase_label(phase: str) -> str:
+    return phase if phase in _KNOWN_PHASES else "other"
+
+
 class ScanMetrics:
     """Records scan and list phase durations."""
 
+    __slots__ = ()
+
     def observe_scan(self, duration: float) -> None:
         scan, _ = _histograms()
         scan.observe(duration)
 
     def observe_list_phase(self, phase: str, duration: float) -> None:
         _, list_duration = _histograms()
-        list_duration.labels(phase=phase).observe(duration)
+        list_duration.labels(_phase_label(phase)).observe(duration)
+
+    def observe_scan_phases(self, duration: float, phase_timings: Mapping[str, float]) -> None:
+        """Record a finished scan and all of its list phases in one call."""
+        scan, list_duration = _histograms()
+        scan.observe(duration)
+        for phase, phase_duration in phase_timings.items():
+            list_duration.labels(_phase_label(phase)).observe(phase_duration)
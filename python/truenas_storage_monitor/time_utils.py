@@ -12,8 +12,11 @@ def utc_now() -> datetime:
 def ensure_utc(dt: datetime) -> datetime:
     """Return a timezone-aware UTC datetime.
 
-    Naive datetimes are treated as UTC.
+    Naive datetimes are treated as UTC. Datetimes already in UTC are returned
+    unchanged.
     """
+    if dt.tzinfo is timezone.utc:
+        return dt
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
@@ -29,8 +32,23 @@ def parse_rfc3339(value: str) -> datetime:
     return ensure_utc(parsed)
 
 
-def resource_age(created: Optional[datetime]) -> Optional[str]:
-    """Format age string for a resource creation time."""
+def format_age(seconds: int) -> str:
+    """Format whole seconds like ``str(timedelta)``, e.g. ``2 days, 3:04:05``."""
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+    clock = f"{hours}:{minutes:02d}:{secs:02d}"
+    if days:
+        return f"{days} day{'' if abs(days) == 1 else 's'}, {clock}"
+    return clock
+
+
+def resource_age(created: Optional[datetime], now: Optional[datetime] = None) -> Optional[str]:
+    """Format age string for a resource creation time, to whole seconds.
+
+    Pass ``now`` to measure many resources against one reference time.
+    """
     if created is None:
         return None
-    return str(utc_now() - ensure_utc(created))
+    delta = (now or utc_now()) - ensure_utc(created)
+    return format_age(delta.days * 86400 + delta.seconds)
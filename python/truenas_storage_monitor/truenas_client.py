@@ -1,19 +1,55 @@
 """TrueNAS REST API client for storage monitoring."""
 
 import logging
-from dataclasses import dataclass, field
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote
 
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+from .cache import InventoryCache
 from .exceptions import TrueNASMonitorError
+from .json_utils import dumps as json_dumps
+from .json_utils import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open to the TrueNAS host. Sized above the default of 10 so
+# concurrent probes, orphan scans and exporter scrapes reuse keep-alive
+# connections instead of opening (and discarding) extra TLS sessions.
+_POOL_MAXSIZE = 32
+
+# Distinct (host, port, retries) adapters kept for reuse by new clients
+_SHARED_ADAPTER_CACHE_SIZE = 16
+
+# Upper bound on pages fetched in parallel by _get_all_pages
+_MAX_PAGE_WORKERS = 8
+
+# How long get_volume_snapshots reuses the dataset list it resolves volumes from
+_DATASET_CACHE_TTL_SECONDS = 60.0
+
+# Parent datasets probed before falling back to the cached dataset list
+_DEFAULT_VOLUME_PARENTS = ("tank/k8s/volumes", "tank/k8s/nfs", "pool0/k8s/volumes", "pool0/k8s/nfs")
+
+# Snapshot IDs are almost always ``pool/dataset@name`` built from this charset,
+# where only "/" and "@" need percent-encoding; anything else goes through quote()
+_PLAIN_SNAPSHOT_ID = re.compile(r"[A-Za-z0-9_.~/@-]+")
+_SNAPSHOT_ID_ESCAPES = str.maketrans({"/": "%2F", "@": "%40"})
+
+
+def _quote_snapshot_id(snapshot_id: str) -> str:
+    """Percent-encode a snapshot ID for use as a single URL path segment."""
+    if _PLAIN_SNAPSHOT_ID.fullmatch(snapshot_id):
+        return snapshot_id.translate(_SNAPSHOT_ID_ESCAPES)
+    return quote(snapshot_id, safe="")
+
 
 class TrueNASError(TrueNASMonitorError):
     """Base exception for TrueNAS client errors."""
@@ -40,20 +76,65 @@ class TrueNASConfig:
     use_https: bool = True
     timeout: int = 30
     max_retries: int = 3
+    page_size: int = 200
 
     def __post_init__(self):
-        """Validate configuration."""
+        """Validate configuration and precompute the API base URL."""
         if not self.api_key and not (self.username and self.password):
             raise ValueError("Either api_key or username/password must be provided")
+        if self.page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {self.page_size}")
+        protocol = "https" if self.use_https else "http"
+        self._base_url = f"{protocol}://{self.host}:{self.port}/api/v2.0"
 
     @property
     def base_url(self) -> str:
         """Get the base URL for TrueNAS API."""
-        protocol = "https" if self.use_https else "http"
-        return f"{protocol}://{self.host}:{self.port}/api/v2.0"
+        return self._base_url
 
 
-@dataclass
+class _JitteredRetry(Retry):
+    """Retry policy that spreads backoff delays by +/-50%.
+
+    Several monitors retrying a throttled or restarting TrueNAS host would
+    otherwise wake up in lockstep. Server-sent ``Retry-After`` delays are
+    honoured as-is.
+    """
+
+    def get_backoff_time(self) -> float:
+        return super().get_backoff_time() * random.uniform(0.5, 1.5)
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pool outlives any single session it is mounted on.
+
+    ``Session.close()`` closes every mounted adapter, which would drop the
+    connections of every other client of the same host. Pooled connections
+    are instead released when the adapter itself is garbage collected.
+    """
+
+    def close(self) -> None:
+        pass
+
+
+@lru_cache(maxsize=_SHARED_ADAPTER_CACHE_SIZE)
+def _shared_adapter(host: str, port: int, max_retries: int) -> HTTPAdapter:
+    """Return the retrying, pooled adapter shared by clients of one TrueNAS host.
+
+    Credentials stay on each client's own session, so clients with different
+    users still reuse the same keep-alive connections. Adapters evicted from
+    the cache stay in use by the clients that already hold them.
+    """
+    retry = _JitteredRetry(
+        total=max_retries,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    return _SharedHTTPAdapter(max_retries=retry, pool_maxsize=_POOL_MAXSIZE)
+
+
+@dataclass(slots=True)
 class PoolInfo:
     """Information about a TrueNAS storage pool."""
 
@@ -65,10 +146,10 @@ class PoolInfo:
     fragmentation: str
     healthy: bool
     scan_state: Optional[str] = None
-    datasets: List[str] = field(default_factory=list)
+    datasets: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetInfo:
     """Information about a ZFS dataset."""
 
@@ -79,10 +160,10 @@ class DatasetInfo:
     referenced_size: int
     quota: Optional[int] = None
     compression_ratio: Optional[str] = None
-    children: List[str] = field(default_factory=list)
+    children: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeInfo:
     """Information about an iSCSI volume/extent."""
 
@@ -95,7 +176,7 @@ class VolumeInfo:
     serial: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SnapshotInfo:
     """Information about a ZFS snapshot."""
 
@@ -107,7 +188,7 @@ class SnapshotInfo:
     full_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OrphanedVolume:
     """Information about an orphaned TrueNAS volume."""
 
@@ -118,6 +199,37 @@ class OrphanedVolume:
     creation_time: Optional[datetime] = None
 
 
+# Shared stand-in for missing nested property dicts; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+
+def _parse_snapshots(items: Iterable[Dict[str, Any]]) -> List[SnapshotInfo]:
+    """Build SnapshotInfo records from ``/zfs/snapshot`` response entries."""
+    fromtimestamp = datetime.fromtimestamp
+    # Recursive and scheduled snapshots share creation times, so convert each
+    # distinct timestamp once
+    created_at: Dict[Any, datetime] = {}
+    snapshots: List[SnapshotInfo] = []
+    append = snapshots.append
+    for snap_data in items:
+        props = snap_data.get("properties") or _EMPTY
+        raw_creation = (props.get("creation") or _EMPTY).get("value", "0")
+        creation_time = created_at.get(raw_creation)
+        if creation_time is None:
+            creation_time = created_at[raw_creation] = fromtimestamp(int(raw_creation))
+        append(
+            SnapshotInfo(
+                name=snap_data.get("snapshot_name", ""),
+                dataset=snap_data.get("dataset", ""),
+                creation_time=creation_time,
+                used_size=int((props.get("used") or _EMPTY).get("value", "0")),
+                referenced_size=int((props.get("referenced") or _EMPTY).get("value", "0")),
+                full_name=snap_data.get("id", ""),
+            )
+        )
+    return snapshots
+
+
 class TrueNASClient:
     """Client for TrueNAS REST API."""
 
@@ -129,17 +241,12 @@ class TrueNASClient:
         """
         self.config = config
         self.base_url = config.base_url
+        self._dataset_cache = InventoryCache(_DATASET_CACHE_TTL_SECONDS)
 
-        # Setup session with retry logic
+        # Setup session with retry logic; the adapter (and its connection
+        # pool) is shared with other clients of the same host
         self.session = requests.Session()
-
-        # Configure retries
-        retry = Retry(
-            total=config.max_retries,
-            backoff_factor=0.3,
-            status_forcelist=[500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = _shared_adapter(config.host, config.port, config.max_retries)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -160,6 +267,10 @@ class TrueNASClient:
             }
         )
 
+    def invalidate_cache(self) -> None:
+        """Drop the cached dataset list used to locate volume datasets."""
+        self._dataset_cache.invalidate()
+
     def test_connection(self) -> bool:
         """Test connection to TrueNAS API.
 
@@ -177,7 +288,7 @@ class TrueNASClient:
                 raise AuthenticationError("Authentication failed with TrueNAS")
 
             response.raise_for_status()
-            logger.info(f"Successfully connected to TrueNAS at {self.config.host}")
+            logger.info("Successfully connected to TrueNAS at %s", self.config.host)
             return True
 
         except requests.exceptions.RequestException as e:
@@ -193,9 +304,8 @@ class TrueNASClient:
             response = self.session.get(f"{self.base_url}/pool", timeout=self.config.timeout)
             response.raise_for_status()
 
-            pools = []
-            for pool_data in response.json():
-                pool = PoolInfo(
+            pools = [
+                PoolInfo(
                     name=pool_data["name"],
                     status=pool_data.get("status", "UNKNOWN"),
                     total_size=pool_data.get("size", 0),
@@ -204,14 +314,14 @@ class TrueNASClient:
                     fragmentation=pool_data.get("fragmentation", "0%"),
                     healthy=pool_data.get("healthy", False),
                     scan_state=pool_data.get("scan", {}).get("state"),
-                    datasets=[],  # Will be populated separately if needed
                 )
-                pools.append(pool)
+                for pool_data in json_loads(response.content)
+            ]
 
-            logger.info(f"Found {len(pools)} storage pools")
+            logger.info("Found %d storage pools", len(pools))
             return pools
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise TrueNASError(f"Failed to get pools: {str(e)}")
 
     def get_datasets(self, pool: Optional[str] = None) -> List[DatasetInfo]:
@@ -228,14 +338,8 @@ class TrueNASClient:
             if pool:
                 params["pool"] = pool
 
-            response = self.session.get(
-                f"{self.base_url}/pool/dataset", params=params, timeout=self.config.timeout
-            )
-            response.raise_for_status()
-
-            datasets = []
-            for ds_data in response.json():
-                dataset = DatasetInfo(
+            datasets = [
+                DatasetInfo(
                     name=ds_data["id"],
                     type=ds_data.get("type", "FILESYSTEM"),
                     used_size=ds_data.get("used", {}).get("value", 0),
@@ -243,14 +347,14 @@ class TrueNASClient:
                     referenced_size=ds_data.get("referenced", {}).get("value", 0),
                     quota=ds_data.get("quota", {}).get("value"),
                     compression_ratio=ds_data.get("compressratio"),
-                    children=[],
                 )
-                datasets.append(dataset)
+                for ds_data in self._get_all_pages("/pool/dataset", params)
+            ]
 
-            logger.info(f"Found {len(datasets)} datasets")
+            logger.info("Found %d datasets", len(datasets))
             return datasets
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise TrueNASError(f"Failed to get datasets: {str(e)}")
 
     def get_volumes(self) -> List[VolumeInfo]:
@@ -260,14 +364,8 @@ class TrueNASClient:
             List of VolumeInfo objects
         """
         try:
-            response = self.session.get(
-                f"{self.base_url}/iscsi/extent", timeout=self.config.timeout
-            )
-            response.raise_for_status()
-
-            volumes = []
-            for extent_data in response.json():
-                volume = VolumeInfo(
+            volumes = [
+                VolumeInfo(
                     name=extent_data["name"],
                     path=extent_data.get("path", ""),
                     size=extent_data.get("filesize", 0),
@@ -276,12 +374,13 @@ class TrueNASClient:
                     naa=extent_data.get("naa"),
                     serial=extent_data.get("serial"),
                 )
-                volumes.append(volume)
+                for extent_data in self._get_all_pages("/iscsi/extent")
+            ]
 
-            logger.info(f"Found {len(volumes)} iSCSI volumes")
+            logger.info("Found %d iSCSI volumes", len(volumes))
             return volumes
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise TrueNASError(f"Failed to get volumes: {str(e)}")
 
     def get_nfs_shares(self) -> List[Dict[str, Any]]:
@@ -291,14 +390,11 @@ class TrueNASClient:
             List of NFS share information
         """
         try:
-            response = self.session.get(f"{self.base_url}/sharing/nfs", timeout=self.config.timeout)
-            response.raise_for_status()
-
-            shares = response.json()
-            logger.info(f"Found {len(shares)} NFS shares")
+            shares = self._get_all_pages("/sharing/nfs")
+            logger.info("Found %d NFS shares", len(shares))
             return shares
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise TrueNASError(f"Failed to get NFS shares: {str(e)}")
 
     def get_snapshots(self, dataset: Optional[str] = None) -> List[SnapshotInfo]:
@@ -315,37 +411,12 @@ class TrueNASClient:
             if dataset:
                 params["dataset"] = dataset
 
-            response = self.session.get(
-                f"{self.base_url}/zfs/snapshot", params=params, timeout=self.config.timeout
-            )
-            response.raise_for_status()
-
-            snapshots = []
-            for snap_data in response.json():
-                # Parse creation time
-                creation_timestamp = (
-                    snap_data.get("properties", {}).get("creation", {}).get("value", "0")
-                )
-                creation_time = datetime.fromtimestamp(int(creation_timestamp))
-
-                snapshot = SnapshotInfo(
-                    name=snap_data.get("snapshot_name", ""),
-                    dataset=snap_data.get("dataset", ""),
-                    creation_time=creation_time,
-                    used_size=int(
-                        snap_data.get("properties", {}).get("used", {}).get("value", "0")
-                    ),
-                    referenced_size=int(
-                        snap_data.get("properties", {}).get("referenced", {}).get("value", "0")
-                    ),
-                    full_name=snap_data.get("id", ""),
-                )
-                snapshots.append(snapshot)
+            snapshots = _parse_snapshots(self._get_all_pages("/zfs/snapshot", params))
 
-            logger.info(f"Found {len(snapshots)} snapshots")
+            logger.info("Found %d snapshots", len(snapshots))
             return snapshots
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise TrueNASError(f"Failed to get snapshots: {str(e)}")
 
     def get_volume_snapshots(self, volume_name: str) -> List[SnapshotInfo]:
@@ -357,16 +428,35 @@ class TrueNASClient:
         Returns:
             List of SnapshotInfo objects
         """
-        # Look for snapshots in common dataset paths
-        dataset_paths = [
-            f"tank/k8s/volumes/{volume_name}",
-            f"tank/k8s/nfs/{volume_name}",
-            f"pool0/k8s/volumes/{volume_name}",
-            f"pool0/k8s/nfs/{volume_name}",
-        ]
-
-        all_snapshots = []
-        for dataset_path in dataset_paths:
+        # Probe the common democratic-csi layouts first, so a volume created
+        # after the dataset listing was cached is still found; the listing is
+        # only consulted for volumes that live elsewhere
+        default_paths = [f"{parent}/{volume_name}" for parent in _DEFAULT_VOLUME_PARENTS]
+        snapshots = self._probe_snapshots(default_paths)
+        if snapshots:
+            return snapshots
+
+        try:
+            datasets = self._dataset_cache.get("datasets", self.get_datasets)
+        except TrueNASError as e:
+            logger.warning("Failed to list datasets for volume %s: %s", volume_name, e)
+            return []
+        return self._probe_snapshots(
+            [
+                dataset.name
+                for dataset in datasets
+                if dataset.name.rpartition("/")[2] == volume_name
+                and dataset.name not in default_paths
+            ]
+        )
+
+    def _probe_snapshots(self, dataset_paths: List[str]) -> List[SnapshotInfo]:
+        """Fetch the snapshots under each dataset path, skipping paths that fail."""
+        if not dataset_paths:
+            return []
+
+        def probe(dataset_path: str) -> List[SnapshotInfo]:
+            snapshots = []
             try:
                 params = {"dataset__startswith": dataset_path}
                 response = self.session.get(
@@ -374,36 +464,20 @@ class TrueNASClient:
                 )
 
                 if response.status_code == 200:
-                    for snap_data in response.json():
-                        creation_timestamp = (
-                            snap_data.get("properties", {}).get("creation", {}).get("value", "0")
-                        )
-                        creation_time = datetime.fromtimestamp(int(creation_timestamp))
-
-                        snapshot = SnapshotInfo(
-                            name=snap_data.get("snapshot_name", ""),
-                            dataset=snap_data.get("dataset", ""),
-                            creation_time=creation_time,
-                            used_size=int(
-                                snap_data.get("properties", {}).get("used", {}).get("value", "0")
-                            ),
-                            referenced_size=int(
-                                snap_data.get("properties", {})
-                                .get("referenced", {})
-                                .get("value", "0")
-                            ),
-                            full_name=snap_data.get("id", ""),
-                        )
-                        all_snapshots.append(snapshot)
+                    snapshots = _parse_snapshots(json_loads(response.content))
             except (requests.exceptions.RequestException, ValueError, TypeError) as e:
                 logger.warning(
                     "Failed to fetch snapshots for dataset path %s: %s",
                     dataset_path,
                     e,
                 )
-                continue
+            return snapshots
 
-        return all_snapshots
+        # Probe every path at once rather than paying a round trip per path
+        with ThreadPoolExecutor(max_workers=len(dataset_paths)) as pool:
+            results = pool.map(probe, dataset_paths)
+
+        return [snapshot for snapshots in results for snapshot in snapshots]
 
     def create_snapshot(self, dataset: str, name: str, recursive: bool = False) -> Dict[str, Any]:
         """Create a ZFS snapshot.
@@ -424,14 +498,14 @@ class TrueNASClient:
             }
 
             response = self.session.post(
-                f"{self.base_url}/zfs/snapshot", json=data, timeout=self.config.timeout
+                f"{self.base_url}/zfs/snapshot", data=json_dumps(data), timeout=self.config.timeout
             )
             response.raise_for_status()
 
-            logger.info(f"Created snapshot {dataset}@{name}")
-            return response.json()
+            logger.info("Created snapshot %s@%s", dataset, name)
+            return json_loads(response.content)
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise TrueNASError(f"Failed to create snapshot: {str(e)}")
 
     def delete_snapshot(self, snapshot_id: str) -> bool:
@@ -444,15 +518,14 @@ class TrueNASClient:
             True if successful
         """
         try:
-            # URL encode the snapshot ID
-            encoded_id = quote(snapshot_id, safe="")
+            encoded_id = _quote_snapshot_id(snapshot_id)
 
             response = self.session.delete(
                 f"{self.base_url}/zfs/snapshot/id/{encoded_id}", timeout=self.config.timeout
             )
             response.raise_for_status()
 
-            logger.info(f"Deleted snapshot {snapshot_id}")
+            logger.info("Deleted snapshot %s", snapshot_id)
             return True
 
         except requests.exceptions.RequestException as e:
@@ -473,7 +546,7 @@ class TrueNASClient:
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             if not data:
                 raise TrueNASError(f"Dataset {dataset} not found")
 
@@ -486,25 +559,39 @@ class TrueNASClient:
                 "children": dataset_info.get("children", []),
             }
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise TrueNASError(f"Failed to get dataset usage: {str(e)}")
 
-    def find_orphaned_volumes(self, k8s_volume_names: List[str]) -> List[OrphanedVolume]:
+    def find_orphaned_volumes(
+        self,
+        k8s_volume_names: Iterable[str],
+        volumes: Optional[List[VolumeInfo]] = None,
+        nfs_shares: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[OrphanedVolume]:
         """Find TrueNAS volumes that don't have corresponding K8s volumes.
 
         Args:
-            k8s_volume_names: List of volume names from Kubernetes
+            k8s_volume_names: Volume names from Kubernetes
+            volumes: Already-fetched iSCSI volumes; fetched when omitted
+            nfs_shares: Already-fetched NFS shares; fetched when omitted
 
         Returns:
             List of orphaned volumes
         """
         orphans = []
-        k8s_names_set = set(k8s_volume_names)
+        k8s_names_set = frozenset(k8s_volume_names)
+
+        # The two listings are independent, so overlap their round trips
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            volumes_future = pool.submit(self.get_volumes) if volumes is None else None
+            shares_future = pool.submit(self.get_nfs_shares) if nfs_shares is None else None
 
         # Check iSCSI volumes
         try:
-            volumes = self.get_volumes()
-            for volume in volumes:
+            iscsi_volumes: List[VolumeInfo] = (
+                volumes_future.result() if volumes_future is not None else volumes or []
+            )
+            for volume in iscsi_volumes:
                 if volume.name not in k8s_names_set:
                     orphan = OrphanedVolume(
                         name=volume.name,
@@ -514,27 +601,28 @@ class TrueNASClient:
                     )
                     orphans.append(orphan)
         except Exception as e:
-            logger.error(f"Failed to check iSCSI volumes: {str(e)}")
+            logger.error("Failed to check iSCSI volumes: %s", e)
 
         # Check NFS shares
         try:
-            shares = self.get_nfs_shares()
+            shares: List[Dict[str, Any]] = (
+                shares_future.result() if shares_future is not None else nfs_shares or []
+            )
             for share in shares:
                 path = share.get("path", "")
                 # Extract volume name from path (e.g., /mnt/tank/k8s/nfs/pvc-xxx)
-                if "/k8s/nfs/" in path:
-                    volume_name = path.split("/k8s/nfs/")[-1]
-                    if volume_name and volume_name not in k8s_names_set:
-                        orphan = OrphanedVolume(
-                            name=volume_name,
-                            path=path,
-                            type="nfs",
-                        )
-                        orphans.append(orphan)
+                _, marker, volume_name = path.rpartition("/k8s/nfs/")
+                if marker and volume_name and volume_name not in k8s_names_set:
+                    orphan = OrphanedVolume(
+                        name=volume_name,
+                        path=path,
+                        type="nfs",
+                    )
+                    orphans.append(orphan)
         except Exception as e:
-            logger.error(f"Failed to check NFS shares: {str(e)}")
+            logger.error("Failed to check NFS shares: %s", e)
 
-        logger.info(f"Found {len(orphans)} orphaned volumes in TrueNAS")
+        logger.info("Found %d orphaned volumes in TrueNAS", len(orphans))
         return orphans
 
     def _get_all_pages(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
@@ -550,31 +638,47 @@ class TrueNASClient:
         if params is None:
             params = {}
 
-        all_items = []
-        offset = 0
-        limit = 50  # TrueNAS default page size
-
-        while True:
-            page_params = {**params, "offset": offset, "limit": limit}
+        url = f"{self.base_url}{endpoint}"
+        limit = self.config.page_size
 
+        def fetch(offset: int) -> requests.Response:
             response = self.session.get(
-                f"{self.base_url}{endpoint}",
-                params=page_params,
+                url,
+                params={**params, "offset": offset, "limit": limit},
                 timeout=self.config.timeout,
             )
             response.raise_for_status()
+            return response
 
-            items = response.json()
-            if not items:
-                break
+        first = fetch(0)
+        all_items = json_loads(first.content)
+        # A short page is the last one; a long one means the server ignored
+        # the limit and already returned everything
+        if len(all_items) != limit:
+            return all_items
 
+        try:
+            total_count = int(first.headers.get("X-Total-Count"))
+        except (TypeError, ValueError):
+            total_count = None
+        if total_count is not None:
+            # The total is known up front, so the remaining pages can be
+            # requested together instead of one round trip at a time
+            offsets = range(limit, total_count, limit)
+            if offsets:
+                workers = min(_MAX_PAGE_WORKERS, len(offsets))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for items in pool.map(lambda o: json_loads(fetch(o).content), offsets):
+                        all_items.extend(items)
+            return all_items
+
+        # Without a total, walk pages until a short one comes back
+        offset = limit
+        while True:
+            items = json_loads(fetch(offset).content)
             all_items.extend(items)
-
-            # Check if there are more pages
-            total_count = response.headers.get("X-Total-Count")
-            if total_count and offset + limit >= int(total_count):
+            if len(items) < limit:
                 break
-
             offset += limit
 
         return all_items
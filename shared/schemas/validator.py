@@ -1,20 +1,46 @@
 """JSON schema validator for shared data models."""
 
+import hashlib
 import json
 import os
+import threading
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 import jsonschema
 from jsonschema import Draft7Validator, ValidationError
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+# Compiled validators shared by every SchemaValidator, keyed by schema file
+_COMPILED: Dict[Path, Draft7Validator] = {}
+# The same validators keyed by file content, so copies of a schema compile once
+_BY_DIGEST: Dict[bytes, Draft7Validator] = {}
+_COMPILE_LOCK = threading.Lock()
+
 
 class SchemaValidator:
     """Validator for JSON schemas used across the project."""
     
+    _SCHEMA_FILES = {
+        "orphaned-resources": "orphaned-resources.json",
+        "storage-analysis": "storage-analysis.json",
+        "config-validation": "config-validation.json",
+    }
+    
     def __init__(self, schema_dir: Optional[Path] = None):
         """Initialize the schema validator.
         
+        Schemas are read and compiled on first use, so a caller that only
+        validates one report type never parses the others. Reading
+        ``schemas`` loads all of them.
+        
         Args:
             schema_dir: Directory containing JSON schema files
         """
@@ -22,43 +48,81 @@ class SchemaValidator:
             schema_dir = Path(__file__).parent
         
         self.schema_dir = schema_dir
-        self.schemas: Dict[str, Dict[str, Any]] = {}
-        self._load_schemas()
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._validators: Dict[str, Draft7Validator] = {}
     
-    def _load_schemas(self):
-        """Load all JSON schemas from the schema directory."""
-        schema_files = {
-            "orphaned-resources": "orphaned-resources.json",
-            "storage-analysis": "storage-analysis.json",
-            "config-validation": "config-validation.json",
-        }
+    @property
+    def schemas(self) -> Dict[str, Dict[str, Any]]:
+        """Loaded schemas by name, loading any that have not been used yet."""
+        for name in self._SCHEMA_FILES:
+            self._get_validator(name)
+        return self._schemas
+    
+    def _get_validator(self, schema_name: str) -> Optional[Draft7Validator]:
+        """Return the compiled validator for a schema, loading it on first use."""
+        validator = self._validators.get(schema_name)
+        if validator is not None:
+            return validator
+        
+        filename = self._SCHEMA_FILES.get(schema_name)
+        if filename is None:
+            return None
+        schema_path = (self.schema_dir / filename).resolve()
         
-        for name, filename in schema_files.items():
-            schema_path = self.schema_dir / filename
-            if schema_path.exists():
-                with open(schema_path, 'r') as f:
-                    self.schemas[name] = json.load(f)
+        # Validators are only read after compilation, so lookups need no lock
+        validator = _COMPILED.get(schema_path)
+        if validator is None:
+            with _COMPILE_LOCK:
+                validator = _COMPILED.get(schema_path)
+                if validator is None:
+                    if not schema_path.exists():
+                        return None
+                    with open(schema_path, 'rb') as f:
+                        raw = f.read()
+                    digest = hashlib.blake2b(raw, digest_size=16).digest()
+                    validator = _BY_DIGEST.get(digest)
+                    if validator is None:
+                        schema = _loads(raw)
+                        # Schemas are fixed once loaded, so check and compile each one once
+                        Draft7Validator.check_schema(schema)
+                        validator = Draft7Validator(schema)
+                        _BY_DIGEST[digest] = validator
+                    _COMPILED[schema_path] = validator
+        
+        self._schemas[schema_name] = validator.schema
+        self._validators[schema_name] = validator
+        return validator
     
-    def validate(self, data: Dict[str, Any], schema_name: str) -> List[str]:
+    def validate(
+        self,
+        data: Dict[str, Any],
+        schema_name: str,
+        max_errors: Optional[int] = None
+    ) -> List[str]:
         """Validate data against a named schema.
         
         Args:
             data: Data to validate
             schema_name: Name of the schema to use
+            max_errors: Stop after this many errors (None for no limit)
             
         Returns:
             List of validation error messages (empty if valid)
+            
+        Raises:
+            ValueError: If max_errors is less than 1
         """
-        if schema_name not in self.schemas:
-            return [f"Unknown schema: {schema_name}"]
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"max_errors must be at least 1, got {max_errors}")
         
-        schema = self.schemas[schema_name]
-        validator = Draft7Validator(schema)
+        validator = self._get_validator(schema_name)
+        if validator is None:
+            return [f"Unknown schema: {schema_name}"]
         
         errors = []
-        for error in validator.iter_errors(data):
+        for error in islice(validator.iter_errors(data), max_errors):
             # Build error path
-            path = ".".join(str(p) for p in error.path) if error.path else "root"
+            path = ".".join(map(str, error.path)) if error.path else "root"
             errors.append(f"{path}: {error.message}")
         
         return errors
@@ -73,7 +137,9 @@ class SchemaValidator:
         Returns:
             True if valid, False otherwise
         """
-        return len(self.validate(data, schema_name)) == 0
+        # Stops at the first error and skips building error messages
+        validator = self._get_validator(schema_name)
+        return validator is not None and validator.is_valid(data)
     
     def validate_orphaned_resources(self, data: Dict[str, Any]) -> List[str]:
         """Validate orphaned resources report data."""
@@ -88,6 +154,12 @@ class SchemaValidator:
         return self.validate(data, "config-validation")
 
 
+@lru_cache(maxsize=None)
+def get_default_validator() -> SchemaValidator:
+    """Return the process-wide validator for the bundled schemas."""
+    return SchemaValidator()
+
+
 def create_orphaned_resource(
     resource_type: str,
     name: str,
@@ -119,28 +191,28 @@ def create_orphaned_resource(
     Returns:
         Orphaned resource dictionary
     """
-    resource = {
-        "type": resource_type,
-        "name": name,
-        "namespace": namespace,
-        "volume_handle": volume_handle,
-        "created_at": created_at,
-        "size_bytes": size_bytes,
-        "location": location,
-        "reason": reason,
-        "remediation": {
-            "action": remediation_action,
-            "safe": safe,
-        },
-        "details": details,
-    }
+    # Fields left as None are omitted, keeping the schema's key order
+    resource = {}
+    for key, value in (
+        ("type", resource_type),
+        ("name", name),
+        ("namespace", namespace),
+        ("volume_handle", volume_handle),
+        ("created_at", created_at),
+        ("size_bytes", size_bytes),
+        ("location", location),
+        ("reason", reason),
+    ):
+        if value is not None:
+            resource[key] = value
     
-    # Remove None values
-    resource = {k: v for k, v in resource.items() if v is not None}
-    if "remediation" in resource:
-        resource["remediation"] = {
-            k: v for k, v in resource["remediation"].items() if v is not None
-        }
+    remediation = {}
+    if remediation_action is not None:
+        remediation["action"] = remediation_action
+    if safe is not None:
+        remediation["safe"] = safe
+    resource["remediation"] = remediation
+    resource["details"] = details
     
     return resource
 
@@ -168,15 +240,14 @@ def create_storage_alert(
     Returns:
         Alert dictionary
     """
-    alert = {
-        "level": level,
-        "category": category,
-        "message": message,
-        "resource": resource,
-        "threshold": threshold,
-        "current_value": current_value,
-        "details": details if details else {},
-    }
+    alert = {"level": level, "category": category, "message": message}
+    if resource is not None:
+        alert["resource"] = resource
+    if threshold is not None:
+        alert["threshold"] = threshold
+    if current_value is not None:
+        alert["current_value"] = current_value
+    if details:
+        alert["details"] = details
     
-    # Remove None values
-    return {k: v for k, v in alert.items() if v is not None}
\ No newline at end of file
+    return alert
\ No newline at end of file